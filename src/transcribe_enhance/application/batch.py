@@ -0,0 +1,175 @@
+"""Offline bulk enhancement of many files through the provider's batch API."""
+
+
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+
+from transcribe_enhance.application.pipeline import prepare_segments, write_output
+from transcribe_enhance.domain.models import Instructions, Segment
+from transcribe_enhance.infrastructure.itt_parser import ParsedItt, parse_itt
+
+
+_logger = logging.getLogger("transcribe_enhance.batch")
+
+
+@dataclass
+class PlannedFile:
+    itt_path: Path
+    output_path: Path
+    original_text: str
+    parsed: ParsedItt
+    segments: list[Segment]
+    chunks: list[tuple[str, list[int]]]
+
+
+def batch_inputs(paths: list[Path], out_dir: Path) -> list[tuple[Path, Path]]:
+    """Pair every ``.itt`` file under ``paths`` with its output path.
+
+    Files found by scanning a directory keep their path relative to it under
+    ``out_dir``, so equal names in different subdirectories stay apart.
+    Explicit files are written by name; two inputs with the same output path
+    are refused.
+    """
+    inputs: list[tuple[Path, Path]] = []
+    for path in paths:
+        if path.is_dir():
+            inputs.extend(
+                (itt_path, out_dir / itt_path.relative_to(path))
+                for itt_path in sorted(path.rglob("*.itt"))
+            )
+        else:
+            inputs.append((path, out_dir / path.name))
+
+    unique: dict[Path, Path] = {}
+    for itt_path, output_path in inputs:
+        other = unique.setdefault(output_path, itt_path)
+        if other.resolve() != itt_path.resolve():
+            raise ValueError(
+                f"{other} and {itt_path} would both be written to {output_path}"
+            )
+    return [(itt_path, output_path) for output_path, itt_path in unique.items()]
+
+
+def plan_batch(
+    inputs: list[tuple[Path, Path]],
+    instructions: Instructions,
+) -> list[PlannedFile]:
+    """Parse every input file and split its pending cues into request chunks.
+
+    ``inputs`` pairs each ``.itt`` file with its output path. Planning is
+    deterministic, so a batch can be collected later by re-planning the same
+    inputs. Custom ids are ``f<file>-c<start>``.
+    """
+    planned: list[PlannedFile] = []
+    for file_number, (itt_path, output_path) in enumerate(inputs):
+        parsed = parse_itt(itt_path)
+        segments, pending = prepare_segments(parsed, instructions)
+        size = instructions.ai.chunk_size or len(pending) or 1
+        chunks = [
+            (f"f{file_number}-c{start}", pending[start : start + size])
+            for start in range(0, len(pending), size)
+        ]
+        planned.append(
+            PlannedFile(
+                itt_path=itt_path,
+                output_path=output_path,
+                original_text=itt_path.read_text(encoding="utf-8"),
+                parsed=parsed,
+                segments=segments,
+                chunks=chunks,
+            )
+        )
+    return planned
+
+
+def apply_batch_results(
+    planned: list[PlannedFile],
+    results: dict[str, str | None],
+    instructions: Instructions,
+) -> list[str]:
+    """Validate each result, patch the cues and write every output file.
+
+    Chunks whose request failed or whose response does not validate keep their
+    locally corrected text; their custom ids are returned.
+    """
+    from transcribe_enhance.infrastructure.ai_openai import parse_segments_output
+
+    unresolved: list[str] = []
+    for planned_file in planned:
+        segments = planned_file.segments
+        local_texts = [segment.text for segment in segments]
+        for custom_id, indices in planned_file.chunks:
+            output_text = results.get(custom_id)
+            if output_text is None:
+                _logger.warning("No batch result for %s; keeping local text", custom_id)
+                unresolved.append(custom_id)
+                continue
+            try:
+                enhanced, _ = parse_segments_output(
+                    output_text, [segments[idx] for idx in indices]
+                )
+            except ValueError as exc:
+                _logger.error("Invalid batch result for %s: %s", custom_id, exc)
+                unresolved.append(custom_id)
+                continue
+            for idx, segment in zip(indices, enhanced, strict=True):
+                segments[idx] = segment
+
+        planned_file.output_path.parent.mkdir(parents=True, exist_ok=True)
+        write_output(
+            planned_file.output_path,
+            planned_file.original_text,
+            planned_file.parsed,
+            segments,
+            instructions,
+            local_texts=local_texts,
+        )
+    return unresolved
+
+
+def run_batch(
+    paths: list[Path],
+    out_dir: Path,
+    instructions: Instructions,
+    batch_file: Path,
+    poll_interval_s: float,
+    batch_id: str | None = None,
+) -> None:
+    """Plan, submit (unless ``batch_id`` is given), wait, and write outputs.
+
+    ``paths`` are ``.itt`` files or directories to scan recursively. Raises
+    RuntimeError when the batch fails outright (nothing is written) or when it
+    does not complete or leaves requests without a valid result (outputs are
+    written, those chunks keep their local text).
+    """
+    if instructions.ai.provider != "openai":
+        raise ValueError(f"Unsupported AI provider: {instructions.ai.provider}")
+
+    from transcribe_enhance.infrastructure import ai_openai, ai_openai_batch
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    planned = plan_batch(batch_inputs(paths, out_dir), instructions)
+    requests = [
+        (custom_id, [planned_file.segments[idx] for idx in indices])
+        for planned_file in planned
+        for custom_id, indices in planned_file.chunks
+    ]
+    _logger.info("Planned %s request(s) across %s file(s)", len(requests), len(planned))
+    if not requests:
+        apply_batch_results(planned, {}, instructions)
+        return
+
+    client = ai_openai.create_client()
+    if batch_id is None:
+        ai_openai_batch.write_batch_file(batch_file, requests, instructions)
+        batch_id = ai_openai_batch.submit_batch(client, batch_file)
+    status, results = ai_openai_batch.wait_for_batch(client, batch_id, poll_interval_s)
+    if status == "failed":
+        raise RuntimeError(f"Batch {batch_id} failed; no outputs were written")
+    unresolved = apply_batch_results(planned, results, instructions)
+    if status != "completed" or unresolved:
+        raise RuntimeError(
+            f"Batch {batch_id} ended with status {status}: {len(unresolved)} of "
+            f"{len(requests)} request(s) have no valid result and keep local text"
+        )
@@ -0,0 +1,150 @@
+"""Two-tier model cascade: a cheap model first, the strong model for rejects."""
+
+
+from dataclasses import dataclass, field
+import logging
+import time
+
+from transcribe_enhance.application.checkpoint import CheckpointJournal
+from transcribe_enhance.application.chunks import Tier, enhance_in_chunks
+from transcribe_enhance.domain.diff import diff_words
+from transcribe_enhance.domain.models import CascadeConfig, OutputRules, Segment
+from transcribe_enhance.domain.rules import check_segment
+
+
+_logger = logging.getLogger("transcribe_enhance.cascade")
+
+
+@dataclass
+class TierStats:
+    name: str
+    model: str
+    requests: int = 0
+    accepted: int = 0
+    latency_s: float = 0.0
+    rejections: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def hit_rate(self) -> float:
+        return self.accepted / self.requests if self.requests else 0.0
+
+    @property
+    def mean_latency_s(self) -> float:
+        return self.latency_s / self.requests if self.requests else 0.0
+
+
+def _rejection_reason(
+    original: list[Segment],
+    candidate: list[Segment],
+    confidences: list[float] | None,
+    rules: OutputRules,
+    cascade: CascadeConfig,
+) -> str | None:
+    if len(candidate) != len(original):
+        return "segment_count"
+    if confidences is not None and min(confidences, default=1.0) < cascade.min_confidence:
+        return "confidence"
+    for idx, (before, after) in enumerate(zip(original, candidate)):
+        if after.text == before.text:
+            continue
+        if diff_words(before.text, after.text).ratio > cascade.max_edit_ratio:
+            return "edit_ratio"
+        # Only new violations count; many source captions already break rules.
+        if len(check_segment(idx, after, rules)) > len(check_segment(idx, before, rules)):
+            return "rules"
+    return None
+
+
+class Cascade:
+    """Tier that tries ``cheap`` first and escalates rejected chunks to ``strong``."""
+
+    def __init__(
+        self,
+        rules: OutputRules,
+        cascade: CascadeConfig,
+        cheap: Tier,
+        strong: Tier,
+        strong_model: str,
+    ) -> None:
+        self.rules = rules
+        self.cascade = cascade
+        self.cheap = cheap
+        self.strong = strong
+        self.cheap_stats = TierStats(name="cheap", model=cascade.model)
+        self.strong_stats = TierStats(name="strong", model=strong_model)
+
+    @property
+    def stats(self) -> list[TierStats]:
+        return [self.cheap_stats, self.strong_stats]
+
+    def __call__(self, chunk: list[Segment]) -> tuple[list[Segment], list[float] | None]:
+        started = time.perf_counter()
+        try:
+            candidate, confidences = self.cheap(chunk)
+        except ValueError as exc:
+            _logger.warning("Cheap tier returned an invalid response: %s", exc)
+            candidate, confidences = None, None
+        self.cheap_stats.requests += 1
+        self.cheap_stats.latency_s += time.perf_counter() - started
+
+        if candidate is None:
+            reason = "invalid_response"
+        else:
+            reason = _rejection_reason(
+                chunk, candidate, confidences, self.rules, self.cascade
+            )
+        if reason is None:
+            self.cheap_stats.accepted += 1
+            return candidate, confidences
+
+        self.cheap_stats.rejections[reason] = self.cheap_stats.rejections.get(reason, 0) + 1
+        _logger.info("Escalating chunk to %s: %s", self.strong_stats.model, reason)
+        started = time.perf_counter()
+        escalated, confidences = self.strong(chunk)
+        self.strong_stats.requests += 1
+        self.strong_stats.latency_s += time.perf_counter() - started
+
+        # The strong tier is terminal, so its result is kept either way; the
+        # same checks only decide whether it counts as a hit.
+        reason = _rejection_reason(chunk, escalated, confidences, self.rules, self.cascade)
+        if reason is None:
+            self.strong_stats.accepted += 1
+        else:
+            self.strong_stats.rejections[reason] = (
+                self.strong_stats.rejections.get(reason, 0) + 1
+            )
+            _logger.warning(
+                "Strong tier result failed %s check; keeping it as the final answer",
+                reason,
+            )
+        return escalated, confidences
+
+    def log_stats(self) -> None:
+        for stats in self.stats:
+            _logger.info(
+                "Cascade tier %s (%s): requests=%s hit_rate=%.2f mean_latency=%.3fs "
+                "rejections=%s",
+                stats.name,
+                stats.model,
+                stats.requests,
+                stats.hit_rate,
+                stats.mean_latency_s,
+                stats.rejections,
+            )
+
+
+def run_cascade(
+    segments: list[Segment],
+    rules: OutputRules,
+    cascade: CascadeConfig,
+    chunk_size: int,
+    cheap: Tier,
+    strong: Tier,
+    strong_model: str,
+    journal: CheckpointJournal | None = None,
+) -> tuple[list[Segment], list[TierStats]]:
+    """Enhance chunks with ``cheap`` and escalate rejected chunks to ``strong``."""
+    tier = Cascade(rules, cascade, cheap, strong, strong_model)
+    updated = enhance_in_chunks(segments, chunk_size, tier, journal)
+    tier.log_stats()
+    return updated, tier.stats
@@ -0,0 +1,144 @@
+"""Write-ahead checkpoint journal so interrupted AI runs can resume."""
+
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+from transcribe_enhance.domain.models import Instructions, Segment
+
+
+_logger = logging.getLogger("transcribe_enhance.checkpoint")
+
+
+def checkpoint_path(output_path: Path) -> Path:
+    return output_path.with_suffix(".checkpoint.jsonl")
+
+
+def run_fingerprint(source_text: str, instructions: Instructions) -> str:
+    """Identify a run by its input file and instructions.
+
+    A journal is only reused when both are unchanged, so edited sources or
+    rules never resume from stale AI output.
+    """
+    digest = hashlib.sha256(source_text.encode("utf-8"))
+    digest.update(repr(instructions).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _chunk_digest(chunk: list[Segment]) -> str:
+    # Chunks are matched by content, not just position, so a resumed run whose
+    # request list shifted (e.g. through deduplication) never reuses stale text.
+    digest = hashlib.sha256()
+    for segment in chunk:
+        entry = f"{segment.start_ms}:{segment.end_ms}:{segment.text}\x1f"
+        digest.update(entry.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class CheckpointJournal:
+    """Append-only JSON Lines log of completed chunks.
+
+    The first line is a header with the run fingerprint, then one line per
+    completed chunk keyed by its start and input digest, and a final
+    ``complete`` line once the output is written. Every line is flushed and
+    fsynced before the next request is sent.
+    """
+
+    def __init__(self, path: Path, fingerprint: str) -> None:
+        self.path = path
+        self.fingerprint = fingerprint
+        self.complete = False
+        # Keyed by (start, input digest): a run may send several request lists.
+        self._chunks: dict[tuple[int, str], list[Segment]] = {}
+        self._file = None
+
+    def open(self, resume: bool) -> None:
+        if resume and self._load():
+            self._file = self.path.open("a", encoding="utf-8")
+            return
+        self._chunks = {}
+        self.complete = False
+        self._file = self.path.open("w", encoding="utf-8")
+        self._append({"type": "header", "fingerprint": self.fingerprint})
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def completed_chunk(self, start: int, chunk: list[Segment]) -> list[Segment] | None:
+        return self._chunks.get((start, _chunk_digest(chunk)))
+
+    def record(self, start: int, chunk: list[Segment], segments: list[Segment]) -> None:
+        digest = _chunk_digest(chunk)
+        self._chunks[(start, digest)] = segments
+        self._append(
+            {
+                "type": "chunk",
+                "start": start,
+                "input": digest,
+                "segments": [
+                    {
+                        "start_ms": segment.start_ms,
+                        "end_ms": segment.end_ms,
+                        "text": segment.text,
+                    }
+                    for segment in segments
+                ],
+            }
+        )
+
+    def mark_complete(self) -> None:
+        self.complete = True
+        self._append({"type": "complete"})
+
+    def _append(self, entry: dict) -> None:
+        assert self._file is not None, "journal is not open"
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _load(self) -> bool:
+        if not self.path.exists():
+            return False
+
+        valid_bytes = 0
+        entries: list[dict] = []
+        with self.path.open("rb") as handle:
+            for raw in handle:
+                # A crash can leave a torn final line; stop at the first bad one.
+                if not raw.endswith(b"\n"):
+                    break
+                try:
+                    entries.append(json.loads(raw))
+                except json.JSONDecodeError:
+                    break
+                valid_bytes += len(raw)
+
+        if not entries or entries[0].get("fingerprint") != self.fingerprint:
+            _logger.info("Ignoring checkpoint with a different fingerprint: %s", self.path)
+            return False
+
+        for entry in entries[1:]:
+            if entry.get("type") == "chunk":
+                self._chunks[(entry["start"], entry["input"])] = [
+                    Segment(
+                        start_ms=item["start_ms"],
+                        end_ms=item["end_ms"],
+                        text=item["text"],
+                    )
+                    for item in entry["segments"]
+                ]
+            elif entry.get("type") == "complete":
+                self.complete = True
+
+        os.truncate(self.path, valid_bytes)
+        _logger.info(
+            "Resuming from checkpoint %s: %s chunk(s) done",
+            self.path,
+            len(self._chunks),
+        )
+        return True
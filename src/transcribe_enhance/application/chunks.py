@@ -0,0 +1,34 @@
+"""Send segments to an AI tier in request-sized chunks."""
+
+
+from typing import Callable
+
+from transcribe_enhance.application.checkpoint import CheckpointJournal
+from transcribe_enhance.domain.models import Segment
+
+
+Tier = Callable[[list[Segment]], tuple[list[Segment], list[float] | None]]
+
+
+def enhance_in_chunks(
+    segments: list[Segment],
+    chunk_size: int,
+    tier: Tier,
+    journal: CheckpointJournal | None = None,
+) -> list[Segment]:
+    """Enhance ``segments`` chunk by chunk; ``chunk_size`` 0 sends one request.
+
+    Chunks already in ``journal`` are reused, and each new chunk is journaled
+    as soon as it completes.
+    """
+    size = chunk_size or len(segments) or 1
+    updated: list[Segment] = []
+    for start in range(0, len(segments), size):
+        chunk = segments[start : start + size]
+        done = journal.completed_chunk(start, chunk) if journal else None
+        if done is None:
+            done, _ = tier(chunk)
+            if journal is not None:
+                journal.record(start, chunk, done)
+        updated.extend(done)
+    return updated
@@ -0,0 +1,77 @@
+"""Validate caption files against output rules without running AI."""
+
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+import os
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+from transcribe_enhance.domain.models import OutputRules, RuleViolation
+from transcribe_enhance.domain.rules import check_output_rules
+from transcribe_enhance.infrastructure.itt_parser import caption_lines, parse_itt
+
+
+@dataclass(frozen=True)
+class LintReport:
+    path: Path
+    segment_count: int
+    violations: list[RuleViolation]
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not self.violations
+
+
+def collect_itt_paths(paths: list[Path]) -> list[Path]:
+    collected: list[Path] = []
+    for path in paths:
+        if path.is_dir():
+            collected.extend(sorted(path.rglob("*.itt")))
+        else:
+            collected.append(path)
+    return collected
+
+
+def lint_file(path: Path, rules: OutputRules) -> LintReport:
+    try:
+        parsed = parse_itt(path)
+    except (OSError, ET.ParseError, ValueError) as exc:
+        return LintReport(path=path, segment_count=0, violations=[], error=str(exc))
+    # Check what is displayed: lines come from <br/>, not from source newlines.
+    segments = [
+        replace(segment, text="\n".join(caption_lines(elem)))
+        for segment, elem in zip(parsed.segments, parsed.p_elements, strict=True)
+    ]
+    return LintReport(
+        path=path,
+        segment_count=len(segments),
+        violations=check_output_rules(segments, rules),
+    )
+
+
+def _lint_file_args(args: tuple[Path, OutputRules]) -> LintReport:
+    return lint_file(*args)
+
+
+def lint_files(
+    paths: list[Path],
+    rules: OutputRules,
+    jobs: int | None = None,
+) -> list[LintReport]:
+    """Lint files in a process pool; reports are returned in input order."""
+    if jobs == 1 or len(paths) <= 1:
+        return [lint_file(path, rules) for path in paths]
+
+    workers = min(jobs or os.cpu_count() or 1, len(paths))
+    # Batch small files per task so IPC does not dominate parse time.
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                _lint_file_args,
+                [(path, rules) for path in paths],
+                chunksize=chunksize,
+            )
+        )
@@ -1,14 +1,38 @@
 """Application pipeline orchestration."""
 
 
+from dataclasses import replace
+import hashlib
+import logging
 from pathlib import Path
+import re
 
-from transcribe_enhance.domain.models import Instructions
-from transcribe_enhance.infrastructure.ai_openai import enhance_segments_openai
-from transcribe_enhance.infrastructure.itt_parser import parse_itt
+from transcribe_enhance.application.checkpoint import (
+    CheckpointJournal,
+    checkpoint_path,
+    run_fingerprint,
+)
+from transcribe_enhance.application.chunks import Tier, enhance_in_chunks
+from transcribe_enhance.domain.dedup import DedupIndex, normalize_text
+from transcribe_enhance.domain.diff import (
+    WordDiff,
+    apply_word_edits,
+    diff_words,
+    format_word_diff,
+)
+from transcribe_enhance.domain.glossary import Glossary
+from transcribe_enhance.domain.models import GlossaryConfig, Instructions, Segment
+from transcribe_enhance.infrastructure.dedup_store import (
+    load_dedup_index,
+    save_dedup_index,
+)
+from transcribe_enhance.infrastructure.itt_parser import ParsedItt, parse_itt
 from transcribe_enhance.infrastructure.itt_writer import write_itt
 
 
+_logger = logging.getLogger("transcribe_enhance.pipeline")
+
+
 def _format_timecode_ms(ms: int) -> str:
     total_seconds, millis = divmod(ms, 1000)
     hours, remainder = divmod(total_seconds, 3600)
@@ -16,93 +40,294 @@ def _format_timecode_ms(ms: int) -> str:
     return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{millis:03d}"
 
 
+def _cue_changed(parsed, segments: list[Segment], idx: int) -> bool:
+    segment = segments[idx]
+    original = parsed.segments[idx]
+    return (
+        segment.text != parsed.original_texts[idx]
+        or segment.start_ms != original.start_ms
+        or segment.end_ms != original.end_ms
+    )
+
+
+def _changed_indices(parsed, segments: list[Segment]) -> list[int]:
+    if len(parsed.segments) != len(segments):
+        raise ValueError(
+            "Segment count does not match original iTT structure. "
+            "Refusing to patch to avoid corrupting the document."
+        )
+    return [idx for idx in range(len(segments)) if _cue_changed(parsed, segments, idx)]
+
+
+def _revert_large_edits(
+    parsed,
+    segments: list[Segment],
+    local_texts: list[str],
+    changed: list[int],
+    max_edit_ratio: float,
+) -> tuple[dict[int, WordDiff], dict[int, str]]:
+    """Diff every changed cue and revert AI edits above ``max_edit_ratio``.
+
+    AI edits are measured against ``local_texts`` and reverted to them, so
+    glossary corrections are neither counted nor undone. Returns the word
+    diffs by index (from the original text, or of the rejected edit) and the
+    rejected (proposed) texts by index. Reverted cues are updated in place in
+    ``segments``.
+    """
+    diffs: dict[int, WordDiff] = {}
+    rejected: dict[int, str] = {}
+    for idx in changed:
+        segment = segments[idx]
+        local_text = local_texts[idx]
+        if segment.text != local_text:
+            edit = diff_words(local_text, segment.text)
+            if edit.ratio > max_edit_ratio:
+                _logger.warning(
+                    "Reverting cue %s: edit ratio %.2f exceeds %.2f",
+                    idx,
+                    edit.ratio,
+                    max_edit_ratio,
+                )
+                diffs[idx] = edit
+                rejected[idx] = segment.text
+                segments[idx] = Segment(
+                    start_ms=segment.start_ms,
+                    end_ms=segment.end_ms,
+                    text=local_text,
+                )
+                continue
+        original_text = parsed.original_texts[idx]
+        if segment.text != original_text:
+            diffs[idx] = diff_words(original_text, segment.text)
+    return diffs, rejected
+
+
 def _write_changes(
     output_path: Path,
     parsed,
-    segments,
+    segments: list[Segment],
+    changed: list[int],
+    diffs: dict[int, WordDiff],
+    rejected: dict[int, str],
+    max_edit_ratio: float,
 ) -> None:
-    changes: list[dict[str, str]] = []
-    for idx, segment in enumerate(segments):
-        original_text = parsed.original_texts[idx]
+    lines: list[str] = []
+    for number, idx in enumerate(sorted(set(changed)), start=1):
+        segment = segments[idx]
         original_begin, original_end = parsed.original_timecodes[idx]
-        original_segment = parsed.segments[idx]
 
-        text_changed = segment.text != original_text
-        time_changed = (
-            segment.start_ms != original_segment.start_ms
-            or segment.end_ms != original_segment.end_ms
+        lines.append(f"Change {number}")
+        lines.append(f"Index: {idx}")
+        lines.append(f"Original Time: {original_begin} --> {original_end}")
+        lines.append(
+            f"New Time: {_format_timecode_ms(segment.start_ms)} --> "
+            f"{_format_timecode_ms(segment.end_ms)}"
         )
-
-        if not text_changed and not time_changed:
-            continue
-
-        change: dict[str, str] = {
-            "index": str(idx),
-            "original_time": f"{original_begin} --> {original_end}",
-            "new_time": (
-                f"{_format_timecode_ms(segment.start_ms)} --> "
-                f"{_format_timecode_ms(segment.end_ms)}"
-            ),
-            "before": original_text,
-            "after": segment.text,
-        }
-        changes.append(change)
+        lines.append(f"Before: {parsed.original_texts[idx]}")
+        lines.append(f"After: {segment.text}")
+        if idx in rejected:
+            lines.append(f"Rejected: {rejected[idx]}")
+        diff = diffs.get(idx)
+        if diff is not None:
+            lines.append(f"Diff: {format_word_diff(diff)}")
+            ratio_line = f"Edit Ratio: {diff.ratio:.2f}"
+            if idx in rejected:
+                ratio_line += f" (exceeds {max_edit_ratio:.2f}, reverted)"
+            lines.append(ratio_line)
+        lines.append("")
 
     changes_path = output_path.with_suffix(".changes.txt")
-    if not changes:
+    if not lines:
         changes_path.write_text("", encoding="utf-8")
         return
 
-    lines: list[str] = []
-    for idx, change in enumerate(changes, start=1):
-        lines.append(f"Change {idx}")
-        lines.append(f"Index: {change['index']}")
-        lines.append(f"Original Time: {change['original_time']}")
-        lines.append(f"New Time: {change['new_time']}")
-        lines.append(f"Before: {change['before']}")
-        lines.append(f"After: {change['after']}")
-        lines.append("")
-
     changes_path.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
 
 
-def _segments_unchanged(parsed, segments) -> bool:
-    if len(parsed.segments) != len(segments):
-        return False
+def _make_tier(instructions: Instructions) -> Tier:
+    """The AI tier for one output: the strong model, or a cascade in front of it.
+
+    Build it once per output so cascade stats cover every pass over the file.
+    """
+    # Provider adapters load only when AI is enabled to keep startup fast.
+    from transcribe_enhance.infrastructure import ai_openai
+
+    ai = instructions.ai
+    strong = ai_openai.make_openai_tier(instructions, ai.model, ai.temperature)
+    if ai.cascade is None:
+        return strong
+
+    from transcribe_enhance.application.cascade import Cascade
+
+    return Cascade(
+        instructions.output_rules,
+        ai.cascade,
+        cheap=ai_openai.make_openai_tier(
+            instructions,
+            ai.cascade.model,
+            ai.cascade.temperature,
+            with_confidence=True,
+        ),
+        strong=strong,
+        strong_model=ai.model,
+    )
+
+
+def _apply_glossary(
+    segments: list[Segment],
+    config: GlossaryConfig,
+) -> set[int]:
+    """Correct glossary terms in place; return the indices of corrected cues."""
+    glossary = Glossary.from_config(config)
+    corrected: set[int] = set()
+    replaced_total = 0
     for idx, segment in enumerate(segments):
-        original = parsed.segments[idx]
-        original_text = parsed.original_texts[idx]
-        if (
-            segment.start_ms != original.start_ms
-            or segment.end_ms != original.end_ms
-            or segment.text != original_text
-        ):
-            return False
-    return True
+        text, replaced = glossary.correct(segment.text)
+        if replaced:
+            segments[idx] = Segment(
+                start_ms=segment.start_ms,
+                end_ms=segment.end_ms,
+                text=text,
+            )
+            corrected.add(idx)
+            replaced_total += replaced
+    _logger.info(
+        "Glossary corrected %s term(s) in %s cue(s)", replaced_total, len(corrected)
+    )
+    return corrected
 
 
-def run_pipeline(
-    audio_path: Path,
-    itt_path: Path,
-    instructions: Instructions,
-    output_path: Path,
-    allow_timing_adjust: bool,
-    enable_ai: bool,
+def _enhance_pending(
+    segments: list[Segment],
+    pending: list[int],
+    tier: Tier,
+    chunk_size: int,
+    journal: CheckpointJournal | None,
 ) -> None:
-    # TODO: validate inputs, run rules, call AI providers
-    _ = audio_path
-    _ = allow_timing_adjust
+    enhanced = enhance_in_chunks([segments[idx] for idx in pending], chunk_size, tier, journal)
+    for idx, segment in zip(pending, enhanced, strict=True):
+        segments[idx] = segment
 
-    parsed = parse_itt(itt_path)
-    original_text = itt_path.read_text(encoding="utf-8")
 
-    segments = parsed.segments
-    if enable_ai:
-        if instructions.ai.provider == "openai":
-            segments = enhance_segments_openai(segments, instructions)
+def _dedup_fingerprint(instructions: Instructions) -> str:
+    # Saved results are only valid for the instructions that produced them.
+    # Dedup and target settings do not change a cue's result, so an index
+    # stays shared between single-language and [targets] runs.
+    return hashlib.sha256(
+        repr(replace(instructions, dedup=None, targets=None)).encode("utf-8")
+    ).hexdigest()
+
+
+def _enhance_deduplicated(
+    segments: list[Segment],
+    pending: list[int],
+    instructions: Instructions,
+    tier: Tier,
+    journal: CheckpointJournal | None,
+    index: DedupIndex,
+) -> None:
+    """Send one representative per duplicate group and fan results out.
+
+    Cues matching an index entry that already has a result (e.g. from an
+    earlier file) are not sent at all. A near duplicate only takes the
+    representative's word edits, replayed on its own text; when they touch
+    words that differ between the two, the cue is sent on its own, as are the
+    duplicates of a representative whose edit ``max_edit_ratio`` rejects.
+    """
+    min_chars = instructions.dedup.min_chars
+    send: list[int] = []
+    representatives: dict[int, int] = {}
+    members: dict[int, int] = {}
+    for idx in pending:
+        text = segments[idx].text
+        # Short cues ("Yes.", "Okay.") depend on their neighbours; never share them.
+        if len(normalize_text(text)) < min_chars:
+            send.append(idx)
+            continue
+        entry_id = index.match(text)
+        if entry_id is None:
+            entry_id = index.add(text)
+            representatives[entry_id] = idx
+            send.append(idx)
         else:
-            raise ValueError(f"Unsupported AI provider: {instructions.ai.provider}")
+            members[idx] = entry_id
+
+    chunk_size = instructions.ai.chunk_size
+    _enhance_pending(segments, send, tier, chunk_size, journal)
+    max_edit_ratio = instructions.ai.max_edit_ratio
+    for entry_id, idx in representatives.items():
+        entry = index.entries[entry_id]
+        result = segments[idx].text
+        # write_output will revert this edit; never store or share it.
+        if diff_words(entry.text, result).ratio <= max_edit_ratio:
+            entry.result = result
+
+    reused = 0
+    resend: list[int] = []
+    for idx, entry_id in members.items():
+        entry = index.entries[entry_id]
+        segment = segments[idx]
+        if entry.result is None:
+            resend.append(idx)
+            continue
+        text = apply_word_edits(entry.text, entry.result, segment.text)
+        if text is None and normalize_text(segment.text) == normalize_text(entry.text):
+            # Same words, different case or punctuation: the result still fits.
+            text = entry.result
+        if text is None:
+            resend.append(idx)
+            continue
+        if entry_id not in representatives:
+            reused += 1
+        segments[idx] = Segment(
+            start_ms=segment.start_ms,
+            end_ms=segment.end_ms,
+            text=text,
+        )
+    if resend:
+        _enhance_pending(segments, resend, tier, chunk_size, journal)
+    _logger.info(
+        "Dedup: sent %s of %s cue(s); %s from index, %s fanned out in this run",
+        len(send) + len(resend),
+        len(pending),
+        reused,
+        len(members) - len(resend) - reused,
+    )
+
+
+def prepare_segments(
+    parsed: ParsedItt,
+    instructions: Instructions,
+) -> tuple[list[Segment], list[int]]:
+    """Apply local corrections and return the segments plus the indices that
+    still need the AI pass."""
+    segments = list(parsed.segments)
+    skip_ai: set[int] = set()
+    if instructions.glossary is not None:
+        corrected = _apply_glossary(segments, instructions.glossary)
+        if instructions.glossary.skip_ai_for_corrected:
+            # Any touched cue is skipped, even if it has errors beyond the glossary.
+            skip_ai = corrected
+    pending = [idx for idx in range(len(segments)) if idx not in skip_ai]
+    return segments, pending
+
+
+def write_output(
+    output_path: Path,
+    original_text: str,
+    parsed: ParsedItt,
+    segments: list[Segment],
+    instructions: Instructions,
+    spans: list[re.Match[str]] | None = None,
+    local_texts: list[str] | None = None,
+) -> None:
+    """Guard edits, patch the output file and write the changes report.
 
+    ``spans`` is the ``<p>`` index of ``original_text``; pass it when writing
+    several outputs from the same source. ``local_texts`` are the cue texts
+    before the AI pass (after glossary corrections); they default to the
+    original texts.
+    """
     # Always preserve original timing for now.
     for idx, segment in enumerate(segments):
         original_segment = parsed.segments[idx]
@@ -116,10 +341,135 @@ def run_pipeline(
                 text=segment.text,
             )
 
-    if _segments_unchanged(parsed, segments):
+    max_edit_ratio = instructions.ai.max_edit_ratio
+    changed = _changed_indices(parsed, segments)
+    if local_texts is None:
+        local_texts = parsed.original_texts
+    diffs, rejected = _revert_large_edits(
+        parsed, segments, local_texts, changed, max_edit_ratio
+    )
+
+    # Only the changed cues are re-checked; rejected edits may leave none.
+    language = instructions.ai.target_language
+    if language is not None or any(_cue_changed(parsed, segments, idx) for idx in changed):
+        write_itt(output_path, original_text, parsed, segments, spans, language)
+    else:
         output_path.write_text(original_text, encoding="utf-8")
-        _write_changes(output_path, parsed, segments)
+    _write_changes(
+        output_path, parsed, segments, changed, diffs, rejected, max_edit_ratio
+    )
+
+
+def enhance_and_write(
+    parsed: ParsedItt,
+    original_text: str,
+    segments: list[Segment],
+    pending: list[int],
+    instructions: Instructions,
+    output_path: Path,
+    enable_ai: bool,
+    resume: bool = False,
+    dedup_index_path: Path | None = None,
+    spans: list[re.Match[str]] | None = None,
+) -> None:
+    """Run the AI pass over the ``pending`` cues and write one output.
+
+    ``segments`` is updated in place. With AI enabled, progress is journaled
+    next to ``output_path`` and an already completed output is skipped on
+    ``resume``.
+    """
+    journal: CheckpointJournal | None = None
+    if enable_ai:
+        journal = CheckpointJournal(
+            checkpoint_path(output_path),
+            run_fingerprint(original_text, instructions),
+        )
+        journal.open(resume)
+        if journal.complete and output_path.exists():
+            _logger.info("Skipping %s: output already complete", output_path)
+            journal.close()
+            return
+
+    local_texts = [segment.text for segment in segments]
+    dedup_index: DedupIndex | None = None
+    if enable_ai and instructions.dedup is not None:
+        dedup_fingerprint = _dedup_fingerprint(instructions)
+        dedup_index = load_dedup_index(
+            dedup_index_path, instructions.dedup.threshold, dedup_fingerprint
+        )
+
+    try:
+        if enable_ai:
+            tier = _make_tier(instructions)
+            if dedup_index is not None:
+                _enhance_deduplicated(
+                    segments, pending, instructions, tier, journal, dedup_index
+                )
+            else:
+                _enhance_pending(
+                    segments, pending, tier, instructions.ai.chunk_size, journal
+                )
+            if instructions.ai.cascade is not None:
+                # One report per output, covering the dedup re-send pass too.
+                tier.log_stats()
+
+        write_output(
+            output_path, original_text, parsed, segments, instructions, spans, local_texts
+        )
+        if journal is not None:
+            journal.mark_complete()
+    finally:
+        if journal is not None:
+            journal.close()
+
+    if dedup_index is not None and dedup_index_path is not None:
+        save_dedup_index(dedup_index_path, dedup_index, dedup_fingerprint)
+
+
+def run_pipeline(
+    audio_path: Path,
+    itt_path: Path,
+    instructions: Instructions,
+    output_path: Path,
+    allow_timing_adjust: bool,
+    enable_ai: bool,
+    resume: bool = False,
+    dedup_index_path: Path | None = None,
+) -> None:
+    # TODO: validate inputs, run rules, call AI providers
+    _ = audio_path
+    _ = allow_timing_adjust
+
+    if enable_ai and instructions.ai.provider != "openai":
+        raise ValueError(f"Unsupported AI provider: {instructions.ai.provider}")
+
+    original_text = itt_path.read_text(encoding="utf-8")
+    parsed = parse_itt(itt_path)
+    segments, pending = prepare_segments(parsed, instructions)
+
+    if enable_ai and instructions.targets is not None:
+        from transcribe_enhance.application.targets import run_targets
+
+        run_targets(
+            parsed,
+            original_text,
+            segments,
+            pending,
+            instructions,
+            output_path,
+            resume,
+            dedup_index_path,
+        )
         return
 
-    write_itt(output_path, original_text, parsed, segments)
-    _write_changes(output_path, parsed, segments)
+    enhance_and_write(
+        parsed,
+        original_text,
+        segments,
+        pending,
+        instructions,
+        output_path,
+        enable_ai,
+        resume,
+        dedup_index_path,
+    )
@@ -0,0 +1,100 @@
+"""Fan one parsed source out to several caption languages."""
+
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+import logging
+from pathlib import Path
+
+from transcribe_enhance.application.pipeline import enhance_and_write
+from transcribe_enhance.domain.models import Instructions, Segment
+from transcribe_enhance.infrastructure.itt_parser import ParsedItt
+from transcribe_enhance.infrastructure.itt_writer import index_paragraphs
+
+
+_logger = logging.getLogger("transcribe_enhance.targets")
+
+
+def target_output_path(output_path: Path, language: str) -> Path:
+    """``out.itt`` -> ``out.<language>.itt``."""
+    return output_path.with_suffix(f".{language}{output_path.suffix}")
+
+
+def target_instructions(instructions: Instructions, language: str) -> Instructions:
+    """Instructions for one target; the source language is enhanced, others translated."""
+    if language == instructions.targets.source_language:
+        return instructions
+    ai = instructions.ai
+    # A translation rewrites every word, so edit-ratio guards would revert it all.
+    cascade = replace(ai.cascade, max_edit_ratio=1.0) if ai.cascade is not None else None
+    return replace(
+        instructions,
+        ai=replace(ai, target_language=language, max_edit_ratio=1.0, cascade=cascade),
+    )
+
+
+def _target_dedup_path(
+    dedup_index_path: Path | None,
+    language: str,
+    source_language: str,
+) -> Path | None:
+    # Enhanced source cues stay shareable with single-language runs; each
+    # translation gets its own index.
+    if dedup_index_path is None or language == source_language:
+        return dedup_index_path
+    return target_output_path(dedup_index_path, language)
+
+
+def run_targets(
+    parsed: ParsedItt,
+    original_text: str,
+    segments: list[Segment],
+    pending: list[int],
+    instructions: Instructions,
+    output_path: Path,
+    resume: bool = False,
+    dedup_index_path: Path | None = None,
+) -> None:
+    """Enhance or translate every target language concurrently.
+
+    All targets share the parse, the locally corrected ``segments`` and the
+    ``<p>`` span index of ``original_text``; each writes its own output,
+    changes report and checkpoint journal.
+    """
+    targets = instructions.targets
+    spans = index_paragraphs(original_text)
+    _logger.info(
+        "Fanning out %s cue(s) to %s target(s): %s",
+        len(segments),
+        len(targets.languages),
+        ", ".join(targets.languages),
+    )
+
+    # Cues the glossary let skip enhancement still need translating.
+    every_cue = list(range(len(segments)))
+    with ThreadPoolExecutor(max_workers=len(targets.languages)) as executor:
+        futures = {
+            language: executor.submit(
+                enhance_and_write,
+                parsed,
+                original_text,
+                list(segments),
+                pending if language == targets.source_language else every_cue,
+                target_instructions(instructions, language),
+                target_output_path(output_path, language),
+                True,
+                resume,
+                _target_dedup_path(dedup_index_path, language, targets.source_language),
+                spans,
+            )
+            for language in targets.languages
+        }
+
+    failed: list[str] = []
+    for language, future in futures.items():
+        exc = future.exception()
+        if exc is not None:
+            _logger.error("Target %s failed: %s", language, exc)
+            failed.append(language)
+    if failed:
+        raise RuntimeError(f"Failed target language(s): {', '.join(failed)}")
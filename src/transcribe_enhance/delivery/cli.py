@@ -2,12 +2,17 @@
 
 
 import argparse
+import json
 import logging
 from pathlib import Path
+import sys
 
 from transcribe_enhance.application.pipeline import run_pipeline
 from transcribe_enhance.domain.models import Context, Instructions
-from transcribe_enhance.infrastructure.toml_config import load_instructions
+from transcribe_enhance.infrastructure.toml_config import (
+    DEFAULT_OUTPUT_RULES,
+    load_instructions,
+)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -39,12 +44,183 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Enable AI enhancement (requires provider configuration and API key)",
     )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Resume from the checkpoint journal next to --out, skipping finished "
+            "chunks (or the whole file if it already completed)"
+        ),
+    )
+    parser.add_argument(
+        "--dedup-index",
+        type=Path,
+        help=(
+            "Path to a JSON index of already enhanced cues, shared across runs so "
+            "repeated boilerplate is only sent to AI once (requires [dedup])"
+        ),
+    )
+    return parser
+
+
+def build_lint_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="transcribe-enhance lint",
+        description="Check .itt files against output rules without running AI.",
+    )
+    parser.add_argument(
+        "paths",
+        type=Path,
+        nargs="+",
+        help="Paths to .itt files or directories to scan recursively",
+    )
+    parser.add_argument(
+        "--instructions",
+        type=Path,
+        help="Path to instructions TOML file (defaults to built-in output rules)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of worker processes (defaults to the CPU count)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=("text", "json"),
+        default="text",
+        help="Output format; json emits one JSON object per file (JSON Lines)",
+    )
+    return parser
+
+
+def build_batch_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="transcribe-enhance batch",
+        description=(
+            "Enhance many .itt files through the provider's asynchronous batch API "
+            "(lower cost, higher latency)."
+        ),
+    )
+    parser.add_argument(
+        "paths",
+        type=Path,
+        nargs="+",
+        help="Paths to .itt files or directories to scan recursively",
+    )
+    parser.add_argument(
+        "--instructions",
+        type=Path,
+        required=True,
+        help="Path to instructions TOML file",
+    )
+    parser.add_argument(
+        "--out-dir",
+        type=Path,
+        required=True,
+        help="Directory for output .itt files and changes reports",
+    )
+    parser.add_argument(
+        "--batch-file",
+        type=Path,
+        help="Where to write the batch request JSONL (defaults to OUT_DIR/batch.jsonl)",
+    )
+    parser.add_argument(
+        "--batch-id",
+        help="Collect an already submitted batch instead of submitting a new one",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=60.0,
+        help="Seconds between batch status checks (default: 60)",
+    )
     return parser
 
 
-def main() -> int:
+def run_batch_command(argv: list[str]) -> int:
+    args = build_batch_parser().parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+
+    from transcribe_enhance.application.batch import run_batch
+
+    try:
+        run_batch(
+            paths=args.paths,
+            out_dir=args.out_dir,
+            instructions=load_instructions(args.instructions),
+            batch_file=args.batch_file or args.out_dir / "batch.jsonl",
+            poll_interval_s=args.poll_interval,
+            batch_id=args.batch_id,
+        )
+    except RuntimeError as exc:
+        logging.getLogger("transcribe_enhance.cli").error("%s", exc)
+        return 1
+    return 0
+
+
+def _lint_report_json(report) -> str:
+    return json.dumps(
+        {
+            "path": str(report.path),
+            "segment_count": report.segment_count,
+            "error": report.error,
+            "violations": [
+                {
+                    "index": violation.index,
+                    "rule": violation.rule,
+                    "value": violation.value,
+                    "limit": violation.limit,
+                    "message": violation.message,
+                }
+                for violation in report.violations
+            ],
+        },
+        ensure_ascii=False,
+    )
+
+
+def _lint_report_text(report) -> str:
+    if report.error is not None:
+        return f"{report.path}: error: {report.error}"
+    if not report.violations:
+        return f"{report.path}: ok ({report.segment_count} cues)"
+    lines = [f"{report.path}: {len(report.violations)} violation(s)"]
+    for violation in report.violations:
+        lines.append(f"  cue {violation.index}: {violation.rule}: {violation.message}")
+    return "\n".join(lines)
+
+
+def run_lint(argv: list[str]) -> int:
+    args = build_lint_parser().parse_args(argv)
+
+    from transcribe_enhance.application.lint import collect_itt_paths, lint_files
+
+    rules = DEFAULT_OUTPUT_RULES
+    if args.instructions:
+        rules = load_instructions(args.instructions).output_rules
+
+    reports = lint_files(collect_itt_paths(args.paths), rules, jobs=args.jobs)
+    render = _lint_report_json if args.format == "json" else _lint_report_text
+    for report in reports:
+        print(render(report))
+
+    return 0 if all(report.ok for report in reports) else 1
+
+
+def main(argv: list[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "lint":
+        return run_lint(argv[1:])
+    if argv and argv[0] == "batch":
+        return run_batch_command(argv[1:])
+
     parser = build_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     logging.basicConfig(
         level=logging.INFO,
@@ -63,6 +239,9 @@ def main() -> int:
             ),
             output_rules=config.output_rules,
             ai=config.ai,
+            glossary=config.glossary,
+            dedup=config.dedup,
+            targets=config.targets,
         )
     run_pipeline(
         audio_path=args.audio,
@@ -71,6 +250,8 @@ def main() -> int:
         output_path=args.out,
         allow_timing_adjust=not args.no_timing_adjust,
         enable_ai=args.enable_ai,
+        resume=args.resume,
+        dedup_index_path=args.dedup_index,
     )
     return 0
 
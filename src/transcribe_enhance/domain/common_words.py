@@ -0,0 +1,76 @@
+"""Frequent English words that generated glossary misspellings must not match."""
+
+
+# Only words of four or more letters matter: shorter fuzzy variants are never
+# generated. Extend per project with ``[glossary] fuzzy_exclude``.
+COMMON_WORDS = frozenset(
+    """
+    able about above accept across action actually added adding after again against
+    agent agree ahead allow almost alone along already also always among amount angle
+    animal another answer anyone anything appear apple apply area argue around arrive
+    article aside asked asking attack author avoid away baby back backend bake ball band
+    bank base basic basis bear beat became because become been before began begin behind
+    being believe below best better between beyond bill bird bite black blade blank
+    block blood blow blue board boat body book boot born both bottle bottom bound bowl
+    brain branch brand bread break bridge brief bright bring broad broke brother brown
+    build built burn business busy call called calls came camera camp card care carry
+    case cash cast catch cause cell center chain chair chance change chapter charge
+    chart check chest child choice choose chose church city claim class clean clear
+    click climb clock close cloud coach coat code coffee cold collect color come comes
+    coming common company compare complete concept control cook cool copy corner correct
+    cost could count country couple course cover crack craft crash create created credit
+    crew cross crowd cups current cycle daily dance dark data date deal dear death
+    debate decide deep default define degree deliver deploy depth describe design desk
+    detail develop device died diet differ dinner direct dirt disk doing done door
+    double down draft drag draw dream dress drink drive drop dust duty each early earn
+    earth ease east easy edge effect effort eight either else empty enable energy engine
+    enjoy enough enter entire entry equal error even event ever every exact example
+    exist expect explain extra face fact fail fair faith fall false family fast father
+    fault fear feed feel field fight figure file fill film final find fine finger finish
+    fire firm first fish five flag flat flight floor flour flow flower focus folder
+    follow food foot force forest forget form format forth forward found four frame free
+    fresh friend from front fruit full fund funny game garden gate gather gave general
+    give given glass goal goes going gold gone good grab grade grand grant grass great
+    green ground group grow growth guard guess guest guide habit hair half hall hand
+    handle hang happen happy hard have head health hear heard heart heat heavy held
+    hello help here hide high hill hint hire history hold hole home hope horse host
+    hotel hour house however huge human idea image impact import include index inside
+    install instead into issue item itself join joke jump just keep kept kick kind king
+    kitchen knew know known label lack land lane large last late later laugh launch
+    layer lead learn least leave left legal length less lesson letter level library life
+    lift light like limit line link list listen little live load local lock long look
+    loop lose loss lost loud love lower luck lunch machine made main major make making
+    manage many mark market master match matter maybe meal mean meant measure meet
+    member memory mention menu merge message metal method middle might mind minute miss
+    mode model modern moment money month more most mother motion mount mouse mouth move
+    movie much music must name narrow nation nature near need never news next nice night
+    nine noise none north note nothing notice number object offer office often okay once
+    only open option order other outside over owner pack page paint pair panel paper
+    parent park part party pass past patch path pattern pause peace people perfect
+    period person phone photo pick picture piece place plain plan plane plant plate play
+    please plus point pool poor port position post pound power press pretty price print
+    private problem process produce product profile program project proper prove public
+    pull push quick quiet quite race rain raise range rate rather reach read ready real
+    reason record release remain remove repeat reply report rest result return review
+    rich ride right ring rise risk river road rock role roll room root rope round route
+    rule rush sack safe said sail sale salt same sand save scale scene school score
+    screen script search season seat second section seem seen select self sell send
+    sense serve service session setup seven shake shall shape share sharp sheet shell
+    shift ship shirt shop short shot should show shut sick side sift sign signal silver
+    simple since sing single sink sister site size skill skin slack slide slip slow
+    small smart smile snow soft solid some song soon sort sound source south space speak
+    special speed spend spent spirit split sport spot spread spring square stack staff
+    stage stair stand star start state stay steel step stick still stock stone stood
+    stop store storm story straight strange stream street stress strike string strip
+    strong stuck study stuff style sugar suit summer sure surface swim switch table tail
+    take talk tall tape task taste teach team tear tell tend term test text than thank
+    that their them then there these they thick thin thing think third this those though
+    three through throw ticket tight time tiny tired title today together told tone took
+    tool total touch toward town track trade train travel treat tree trip true trust
+    truth turn twice type under unit until update upon upper used user using usual value
+    very view visit voice wait walk wall want warm wash watch water wave weak wear week
+    weight well went were west what wheel when where which while white whole whom whose
+    wide wife wild will wind window wing winter wire wish with within without woman wood
+    word work world worry would write wrong yard year yellow young your zero
+    """.split()
+)
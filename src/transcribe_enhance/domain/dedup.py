@@ -0,0 +1,112 @@
+"""Exact and near-duplicate cue detection with MinHash + LSH."""
+
+
+from dataclasses import dataclass
+from functools import lru_cache
+import hashlib
+import re
+import struct
+
+
+_NUM_PERM = 32
+_BANDS = 8
+_ROWS = _NUM_PERM // _BANDS
+_SHINGLE = 5
+# Two 64-byte BLAKE2b digests per shingle give 32 independent 32-bit hashes;
+# fixed salts keep signatures stable across processes for a shared index.
+_SALTS = (b"tranzcribe-mh-0", b"tranzcribe-mh-1")
+_UNPACK = struct.Struct("<16I").unpack
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return " ".join(_NON_WORD.sub(" ", text.lower()).split())
+
+
+def _shingles(normalized: str) -> frozenset[str]:
+    if len(normalized) <= _SHINGLE:
+        return frozenset([normalized])
+    return frozenset(
+        normalized[idx : idx + _SHINGLE] for idx in range(len(normalized) - _SHINGLE + 1)
+    )
+
+
+def _shingle_hashes(shingle: str) -> tuple[int, ...]:
+    data = shingle.encode("utf-8")
+    hashes: tuple[int, ...] = ()
+    for salt in _SALTS:
+        hashes += _UNPACK(hashlib.blake2b(data, digest_size=64, salt=salt).digest())
+    return hashes
+
+
+def _minhash(shingles: frozenset[str]) -> tuple[int, ...]:
+    return tuple(map(min, zip(*map(_shingle_hashes, shingles))))
+
+
+@lru_cache(maxsize=4096)
+def _features(text: str) -> tuple[str, frozenset[str], tuple[int, ...]]:
+    normalized = normalize_text(text)
+    shingles = _shingles(normalized)
+    return normalized, shingles, _minhash(shingles)
+
+
+def _jaccard(left: frozenset[str], right: frozenset[str]) -> float:
+    if not left and not right:
+        return 1.0
+    return len(left & right) / len(left | right)
+
+
+@dataclass
+class DedupEntry:
+    text: str
+    result: str | None
+    shingles: frozenset[str]
+
+
+class DedupIndex:
+    """Groups cue texts that are equal after normalization or whose shingle
+    Jaccard similarity is at least ``threshold``.
+
+    Exact duplicates are found by normalized text; near duplicates by LSH over
+    MinHash signatures, with candidates confirmed by exact Jaccard.
+    """
+
+    def __init__(self, threshold: float) -> None:
+        self.threshold = threshold
+        self.entries: list[DedupEntry] = []
+        self._exact: dict[str, int] = {}
+        self._buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+
+    def match(self, text: str) -> int | None:
+        normalized, shingles, signature = _features(text)
+        entry_id = self._exact.get(normalized)
+        if entry_id is not None:
+            return entry_id
+        if self.threshold >= 1.0:
+            return None
+
+        best_id: int | None = None
+        best_score = self.threshold
+        seen: set[int] = set()
+        for band in range(_BANDS):
+            key = (band, signature[band * _ROWS : (band + 1) * _ROWS])
+            for candidate in self._buckets.get(key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                score = _jaccard(shingles, self.entries[candidate].shingles)
+                if score >= best_score:
+                    best_id, best_score = candidate, score
+        return best_id
+
+    def add(self, text: str, result: str | None = None) -> int:
+        normalized, shingles, signature = _features(text)
+        entry_id = len(self.entries)
+        self.entries.append(DedupEntry(text=text, result=result, shingles=shingles))
+        self._exact.setdefault(normalized, entry_id)
+        for band in range(_BANDS):
+            key = (band, signature[band * _ROWS : (band + 1) * _ROWS])
+            self._buckets.setdefault(key, []).append(entry_id)
+        return entry_id
@@ -0,0 +1,241 @@
+"""Word-level diffs between original and enhanced caption text."""
+
+
+from dataclasses import dataclass
+import re
+from typing import Literal
+
+
+@dataclass(frozen=True)
+class WordEdit:
+    op: Literal["equal", "delete", "insert"]
+    words: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class WordDiff:
+    edits: list[WordEdit]
+    distance: int
+    ratio: float
+
+    @property
+    def changed(self) -> bool:
+        return self.distance > 0
+
+
+def _middle_snake(
+    a: list[str], a_lo: int, a_hi: int, b: list[str], b_lo: int, b_hi: int
+) -> tuple[int, int, int, int]:
+    # Myers' linear-space search: run the greedy forward and reverse passes
+    # until they overlap and return the middle snake as (x, y, u, v), relative
+    # to (a_lo, b_lo).
+    n = a_hi - a_lo
+    m = b_hi - b_lo
+    delta = n - m
+    odd = delta % 2 != 0
+    max_d = (n + m + 1) // 2
+    offset = max_d + 1
+    forward = [0] * (2 * offset + 1)
+    backward = [0] * (2 * offset + 1)
+
+    for d in range(max_d + 1):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[offset + k - 1] < forward[offset + k + 1]):
+                x = forward[offset + k + 1]
+            else:
+                x = forward[offset + k - 1] + 1
+            y = x - k
+            x_start, y_start = x, y
+            while x < n and y < m and a[a_lo + x] == b[b_lo + y]:
+                x += 1
+                y += 1
+            forward[offset + k] = x
+            c = delta - k
+            if odd and -(d - 1) <= c <= d - 1 and x + backward[offset + c] >= n:
+                return x_start, y_start, x, y
+
+        for c in range(-d, d + 1, 2):
+            if c == -d or (c != d and backward[offset + c - 1] < backward[offset + c + 1]):
+                x = backward[offset + c + 1]
+            else:
+                x = backward[offset + c - 1] + 1
+            y = x - c
+            x_start, y_start = x, y
+            while x < n and y < m and a[a_hi - 1 - x] == b[b_hi - 1 - y]:
+                x += 1
+                y += 1
+            backward[offset + c] = x
+            k = delta - c
+            if not odd and -d <= k <= d and x + forward[offset + k] >= n:
+                return n - x, m - y, n - x_start, m - y_start
+
+    raise AssertionError("Myers search did not converge")
+
+
+def _diff_range(
+    a: list[str],
+    a_lo: int,
+    a_hi: int,
+    b: list[str],
+    b_lo: int,
+    b_hi: int,
+    ops: list[tuple[str, str]],
+) -> None:
+    prefix_end = a_lo
+    while prefix_end < a_hi and b_lo < b_hi and a[prefix_end] == b[b_lo]:
+        ops.append(("equal", a[prefix_end]))
+        prefix_end += 1
+        b_lo += 1
+    a_lo = prefix_end
+
+    suffix: list[tuple[str, str]] = []
+    while a_lo < a_hi and b_lo < b_hi and a[a_hi - 1] == b[b_hi - 1]:
+        suffix.append(("equal", a[a_hi - 1]))
+        a_hi -= 1
+        b_hi -= 1
+
+    if a_lo == a_hi:
+        ops.extend(("insert", word) for word in b[b_lo:b_hi])
+    elif b_lo == b_hi:
+        ops.extend(("delete", word) for word in a[a_lo:a_hi])
+    else:
+        x, y, u, v = _middle_snake(a, a_lo, a_hi, b, b_lo, b_hi)
+        _diff_range(a, a_lo, a_lo + x, b, b_lo, b_lo + y, ops)
+        ops.extend(("equal", word) for word in a[a_lo + x : a_lo + u])
+        _diff_range(a, a_lo + u, a_hi, b, b_lo + v, b_hi, ops)
+
+    ops.extend(reversed(suffix))
+
+
+def diff_words(before: str, after: str) -> WordDiff:
+    """Return the shortest word-level edit script turning ``before`` into ``after``.
+
+    Uses Myers' O((N+M)D) algorithm with the linear-space middle-snake
+    refinement. ``ratio`` is the edit distance (inserted plus deleted words)
+    divided by the total word count, so 0.0 is identical and 1.0 is a full
+    rewrite.
+    """
+    a = before.split()
+    b = after.split()
+    ops: list[tuple[str, str]] = []
+    _diff_range(a, 0, len(a), b, 0, len(b), ops)
+
+    edits: list[WordEdit] = []
+    distance = 0
+    run_op: str | None = None
+    run_words: list[str] = []
+    for op, word in ops:
+        if op != "equal":
+            distance += 1
+        if op != run_op and run_words:
+            edits.append(WordEdit(op=run_op, words=tuple(run_words)))
+            run_words = []
+        run_op = op
+        run_words.append(word)
+    if run_words:
+        edits.append(WordEdit(op=run_op, words=tuple(run_words)))
+
+    total = len(a) + len(b)
+    ratio = distance / total if total else 0.0
+    return WordDiff(edits=edits, distance=distance, ratio=ratio)
+
+
+def _alignment(before: list[str], diff: WordDiff) -> list[int | None]:
+    # Position in the other text of each word of ``before``, None if not kept.
+    positions: list[int | None] = []
+    other = 0
+    for edit in diff.edits:
+        if edit.op == "equal":
+            positions.extend(range(other, other + len(edit.words)))
+            other += len(edit.words)
+        elif edit.op == "delete":
+            positions.extend([None] * len(edit.words))
+        else:
+            other += len(edit.words)
+    assert len(positions) == len(before)
+    return positions
+
+
+def _hunks(diff: WordDiff) -> list[tuple[int, int, tuple[str, ...]]]:
+    # Adjacent deletes and inserts as (start, end, replacement) over ``before``.
+    hunks: list[tuple[int, int, tuple[str, ...]]] = []
+    position = 0
+    previous = "equal"
+    for edit in diff.edits:
+        if edit.op == "equal":
+            position += len(edit.words)
+        else:
+            if previous == "equal":
+                hunks.append((position, position, ()))
+            start, end, words = hunks[-1]
+            if edit.op == "delete":
+                position += len(edit.words)
+                hunks[-1] = (start, position, words)
+            else:
+                hunks[-1] = (start, end, words + edit.words)
+        previous = edit.op
+    return hunks
+
+
+def apply_word_edits(before: str, after: str, target: str) -> str | None:
+    """Replay the word edits that turn ``before`` into ``after`` on ``target``.
+
+    Each edited span must appear unchanged in ``target``, including the words
+    on either side of it; otherwise the edits do not apply cleanly and None is
+    returned. Words outside the edited spans, and their spacing, are kept.
+    """
+    source = before.split()
+    edits = diff_words(before, after)
+    if not edits.changed:
+        return target
+
+    spans = [match.span() for match in re.finditer(r"\S+", target)]
+    positions = _alignment(source, diff_words(before, target))
+    replacements: list[tuple[int, int, tuple[str, ...]]] = []
+    for start, end, words in _hunks(edits):
+        anchors = positions[start:end]
+        if start > 0:
+            anchors = [positions[start - 1], *anchors]
+        if end < len(source):
+            anchors = [*anchors, positions[end]]
+        if None in anchors:
+            return None
+        low = positions[start - 1] + 1 if start > 0 else 0
+        high = positions[end] if end < len(source) else len(spans)
+        if high - low != end - start:
+            return None
+        replacements.append((low, high, words))
+
+    result = target
+    for low, high, words in reversed(replacements):
+        text = " ".join(words)
+        if low < high:
+            cut_start, cut_end = spans[low][0], spans[high - 1][1]
+            if not text:
+                # Drop the removed words together with one side's spacing.
+                if high < len(spans):
+                    cut_end = spans[high][0]
+                elif low > 0:
+                    cut_start = spans[low - 1][1]
+        elif low < len(spans):
+            cut_start = cut_end = spans[low][0]
+            text += " "
+        else:
+            cut_start = cut_end = spans[-1][1] if spans else len(target)
+            text = (" " if spans else "") + text
+        result = result[:cut_start] + text + result[cut_end:]
+    return result
+
+
+def format_word_diff(diff: WordDiff) -> str:
+    """Render a diff inline, wdiff style: ``[-removed-]`` and ``{+added+}``."""
+    parts: list[str] = []
+    for edit in diff.edits:
+        text = " ".join(edit.words)
+        if edit.op == "delete":
+            parts.append(f"[-{text}-]")
+        elif edit.op == "insert":
+            parts.append(f"{{+{text}+}}")
+        else:
+            parts.append(text)
+    return " ".join(parts)
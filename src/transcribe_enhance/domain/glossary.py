@@ -0,0 +1,142 @@
+"""Glossary term correction with a multi-pattern (Aho-Corasick) matcher."""
+
+
+from collections import deque
+
+from transcribe_enhance.domain.common_words import COMMON_WORDS
+from transcribe_enhance.domain.models import GlossaryConfig
+
+
+# Generated misspellings for short terms collide with real words too often.
+_MIN_FUZZY_LENGTH = 5
+
+
+def _lower_aligned(text: str) -> str:
+    # str.lower() can change length for a few characters (e.g. "İ"); keep the
+    # original character there so match offsets line up with ``text``.
+    return "".join(
+        lowered if len(lowered := char.lower()) == 1 else char for char in text
+    )
+
+
+def fuzzy_variants(term: str) -> set[str]:
+    """Common ASR misspellings of ``term``.
+
+    Covers one dropped letter (including a collapsed double letter) and two
+    swapped adjacent letters. The first letter is always kept.
+    """
+    if len(term) < _MIN_FUZZY_LENGTH or " " in term:
+        return set()
+    variants: set[str] = set()
+    for idx in range(1, len(term)):
+        variants.add(term[:idx] + term[idx + 1 :])
+        if idx < len(term) - 1:
+            variants.add(term[:idx] + term[idx + 1] + term[idx] + term[idx + 2 :])
+    variants.discard(term)
+    return {variant for variant in variants if len(variant) >= _MIN_FUZZY_LENGTH - 1}
+
+
+class Glossary:
+    """Replace known terms and their misspellings with the canonical spelling.
+
+    All patterns are compiled into one Aho-Corasick automaton over lowercased
+    text, so a cue is corrected in a single pass regardless of glossary size.
+    Matches must sit on word boundaries; overlapping matches resolve to the
+    leftmost, then longest.
+    """
+
+    def __init__(self, patterns: dict[str, str]) -> None:
+        self._patterns = list(patterns.items())
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+        for pattern_id, (pattern, _) in enumerate(self._patterns):
+            self._insert(pattern, pattern_id)
+        self._build_failure_links()
+
+    @classmethod
+    def from_config(cls, config: GlossaryConfig) -> "Glossary":
+        patterns: dict[str, str] = {}
+        for canonical, variants in config.terms.items():
+            for pattern in (canonical, *variants):
+                patterns.setdefault(_lower_aligned(pattern), canonical)
+        # Fuzzy variants never override an explicit term or variant, and never
+        # turn a real word ("sift", "strip") into a term.
+        if config.fuzzy:
+            excluded = COMMON_WORDS | {
+                _lower_aligned(word) for word in config.fuzzy_exclude
+            }
+            for canonical in config.terms:
+                for variant in fuzzy_variants(_lower_aligned(canonical)):
+                    if variant not in excluded:
+                        patterns.setdefault(variant, canonical)
+        return cls(patterns)
+
+    def _insert(self, pattern: str, pattern_id: int) -> None:
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+        self._output[state].append(pattern_id)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def _matches(self, text: str) -> list[tuple[int, int, str]]:
+        lowered = _lower_aligned(text)
+        found: list[tuple[int, int, str]] = []
+        state = 0
+        for end, char in enumerate(lowered, start=1):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for pattern_id in self._output[state]:
+                pattern, canonical = self._patterns[pattern_id]
+                start = end - len(pattern)
+                if start > 0 and text[start - 1].isalnum():
+                    continue
+                if end < len(text) and text[end].isalnum():
+                    continue
+                found.append((start, end, canonical))
+
+        found.sort(key=lambda match: (match[0], match[0] - match[1]))
+        selected: list[tuple[int, int, str]] = []
+        last_end = 0
+        for start, end, canonical in found:
+            if start >= last_end:
+                selected.append((start, end, canonical))
+                last_end = end
+        return selected
+
+    def correct(self, text: str) -> tuple[str, int]:
+        """Return the corrected text and the number of terms replaced."""
+        parts: list[str] = []
+        replaced = 0
+        last_end = 0
+        for start, end, canonical in self._matches(text):
+            if text[start:end] == canonical:
+                continue
+            parts.append(text[last_end:start])
+            parts.append(canonical)
+            replaced += 1
+            last_end = end
+        if not replaced:
+            return text, 0
+        parts.append(text[last_end:])
+        return "".join(parts), replaced
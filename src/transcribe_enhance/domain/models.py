@@ -16,6 +16,7 @@ class OutputRules:
     casing: Literal["sentence", "upper", "lower"]
     punctuation: Literal["standard", "minimal", "strict"]
     profanity_policy: Literal["mask", "keep", "remove"]
+    min_gap_ms: int = 0
 
 
 @dataclass(frozen=True)
@@ -26,11 +27,51 @@ class Context:
     details: str
 
 
+@dataclass(frozen=True)
+class CascadeConfig:
+    model: str
+    temperature: float
+    min_confidence: float
+    max_edit_ratio: float
+
+
+@dataclass(frozen=True)
+class RetrievalConfig:
+    top_k: int
+    max_tokens: int
+
+
 @dataclass(frozen=True)
 class AIConfig:
     provider: Literal["openai", "gemini"]
     model: str
     temperature: float
+    max_edit_ratio: float = 1.0
+    chunk_size: int = 0
+    cascade: CascadeConfig | None = None
+    retrieval: RetrievalConfig | None = None
+    # Set per target by multi-language runs; None edits in the source language.
+    target_language: str | None = None
+
+
+@dataclass(frozen=True)
+class GlossaryConfig:
+    terms: dict[str, tuple[str, ...]]
+    fuzzy: bool
+    skip_ai_for_corrected: bool
+    fuzzy_exclude: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class DedupConfig:
+    threshold: float
+    min_chars: int
+
+
+@dataclass(frozen=True)
+class TargetsConfig:
+    source_language: str
+    languages: tuple[str, ...]
 
 
 @dataclass(frozen=True)
@@ -38,6 +79,9 @@ class Instructions:
     context: Context
     output_rules: OutputRules
     ai: AIConfig
+    glossary: GlossaryConfig | None = None
+    dedup: DedupConfig | None = None
+    targets: TargetsConfig | None = None
 
 
 @dataclass(frozen=True)
@@ -45,3 +89,20 @@ class Segment:
     start_ms: int
     end_ms: int
     text: str
+
+
+@dataclass(frozen=True)
+class RuleViolation:
+    index: int
+    rule: Literal[
+        "overlap",
+        "gap",
+        "reading_speed",
+        "line_length",
+        "line_count",
+        "min_duration",
+        "max_duration",
+    ]
+    value: float
+    limit: float
+    message: str
@@ -0,0 +1,207 @@
+"""Select the passages of a details document relevant to a chunk of captions."""
+
+
+from collections import Counter
+import hashlib
+import math
+import re
+
+
+_TOKEN = re.compile(r"\w+")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+_PASSAGE_WORDS = 150
+_K1 = 1.5
+_B = 0.75
+# Rough OpenAI-style estimate; avoids a tokenizer dependency for a budget check.
+_CHARS_PER_TOKEN = 4
+
+_STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have i if in is it its of on or so "
+    "that the their then there these this to was we were will with you your".split()
+)
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / _CHARS_PER_TOKEN)
+
+
+def _terms(text: str) -> list[str]:
+    return [
+        token
+        for token in _TOKEN.findall(text.lower())
+        if token not in _STOPWORDS
+    ]
+
+
+def _split_paragraph(text: str) -> list[str]:
+    """Cut a paragraph longer than ``_PASSAGE_WORDS`` at sentence boundaries,
+    and an overlong sentence at word boundaries."""
+    if len(text.split()) <= _PASSAGE_WORDS:
+        return [text]
+    pieces: list[str] = []
+    for sentence in _SENTENCE_END.split(text):
+        words = sentence.split()
+        pieces.extend(
+            " ".join(words[start : start + _PASSAGE_WORDS])
+            for start in range(0, len(words), _PASSAGE_WORDS)
+        )
+    chunks: list[str] = []
+    group: list[str] = []
+    count = 0
+    for piece in pieces:
+        size = len(piece.split())
+        if group and count + size > _PASSAGE_WORDS:
+            chunks.append(" ".join(group))
+            group, count = [], 0
+        group.append(piece)
+        count += size
+    if group:
+        chunks.append(" ".join(group))
+    return chunks
+
+
+def _truncate(passage: str, max_tokens: int) -> str:
+    limit = max(max_tokens, 0) * _CHARS_PER_TOKEN
+    if len(passage) <= limit:
+        return passage
+    cut = passage[:limit]
+    if not passage[limit].isspace():
+        # Drop the partial last word when there is an earlier boundary.
+        head = cut.rsplit(None, 1)
+        if len(head) == 2:
+            cut = head[0]
+    return cut.rstrip()
+
+
+def split_passages(details: str) -> list[str]:
+    """Split a Markdown or plain-text document into passages.
+
+    Each heading starts a new section; paragraphs within a section are grouped
+    up to roughly 150 words, and every passage keeps its section heading.
+    Longer paragraphs (e.g. a file without blank lines) are cut at sentence
+    or word boundaries first.
+    """
+    passages: list[str] = []
+    heading = ""
+    paragraphs: list[str] = []
+    paragraph: list[str] = []
+
+    def _flush_paragraph() -> None:
+        if paragraph:
+            paragraphs.append("\n".join(paragraph))
+            paragraph.clear()
+
+    def _flush_section() -> None:
+        _flush_paragraph()
+        group: list[str] = []
+        words = 0
+        pieces = [piece for text in paragraphs for piece in _split_paragraph(text)]
+        for text in pieces:
+            count = len(text.split())
+            if group and words + count > _PASSAGE_WORDS:
+                passages.append("\n\n".join([heading, *group] if heading else group))
+                group, words = [], 0
+            group.append(text)
+            words += count
+        if group:
+            passages.append("\n\n".join([heading, *group] if heading else group))
+        paragraphs.clear()
+
+    for line in details.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            _flush_section()
+            heading = stripped
+        elif not stripped:
+            _flush_paragraph()
+        else:
+            paragraph.append(line)
+    _flush_section()
+    return passages
+
+
+class Bm25Index:
+    """Okapi BM25 over the passages of one details document."""
+
+    def __init__(self, passages: list[str]) -> None:
+        self.passages = passages
+        self._term_counts = [Counter(_terms(passage)) for passage in passages]
+        self._lengths = [sum(counts.values()) for counts in self._term_counts]
+        self._avg_length = (sum(self._lengths) / len(passages)) if passages else 0.0
+        document_frequency: Counter[str] = Counter()
+        for counts in self._term_counts:
+            document_frequency.update(counts.keys())
+        total = len(passages)
+        self._idf = {
+            term: math.log(1 + (total - df + 0.5) / (df + 0.5))
+            for term, df in document_frequency.items()
+        }
+
+    def scores(self, query: str) -> list[float]:
+        query_terms = set(_terms(query)) & self._idf.keys()
+        scores: list[float] = []
+        for counts, length in zip(self._term_counts, self._lengths):
+            norm = _K1 * (1 - _B + _B * length / self._avg_length) if self._avg_length else _K1
+            score = 0.0
+            for term in query_terms:
+                tf = counts.get(term, 0)
+                if tf:
+                    score += self._idf[term] * tf * (_K1 + 1) / (tf + norm)
+            scores.append(score)
+        return scores
+
+    def select(self, query: str, top_k: int, max_tokens: int) -> str:
+        """Return up to ``top_k`` relevant passages within ``max_tokens``.
+
+        Passages are picked by score and returned in document order. When no
+        passage shares a term with the query (common for short cues), the
+        opening passages are used as general background instead. When no whole
+        passage fits the budget, the best one is truncated to it, so non-empty
+        details never yield an empty selection.
+        """
+        scores = self.scores(query)
+        ranked = sorted(
+            (idx for idx, score in enumerate(scores) if score > 0),
+            key=lambda idx: scores[idx],
+            reverse=True,
+        )
+        if not ranked:
+            return self._leading(top_k, max_tokens)
+        chosen: list[int] = []
+        budget = max_tokens
+        for idx in ranked:
+            if len(chosen) == top_k:
+                break
+            cost = estimate_tokens(self.passages[idx])
+            if cost <= budget:
+                chosen.append(idx)
+                budget -= cost
+        if not chosen and top_k > 0:
+            return _truncate(self.passages[ranked[0]], max_tokens)
+        return "\n\n".join(self.passages[idx] for idx in sorted(chosen))
+
+    def _leading(self, top_k: int, max_tokens: int) -> str:
+        chosen: list[str] = []
+        budget = max_tokens
+        for passage in self.passages[:top_k]:
+            cost = estimate_tokens(passage)
+            if cost > budget:
+                break
+            chosen.append(passage)
+            budget -= cost
+        if not chosen and self.passages and top_k > 0:
+            return _truncate(self.passages[0], max_tokens)
+        return "\n\n".join(chosen)
+
+
+_INDEX_CACHE: dict[str, Bm25Index] = {}
+
+
+def details_index(details: str) -> Bm25Index:
+    """Return the BM25 index for ``details``, cached by content hash."""
+    key = hashlib.sha256(details.encode("utf-8")).hexdigest()
+    index = _INDEX_CACHE.get(key)
+    if index is None:
+        index = Bm25Index(split_passages(details))
+        _INDEX_CACHE[key] = index
+    return index
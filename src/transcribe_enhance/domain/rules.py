@@ -1,10 +1,121 @@
 """Rules and utilities to enforce subtitle constraints."""
 
 
-from transcribe_enhance.domain.models import OutputRules, Segment
+from transcribe_enhance.domain.models import OutputRules, RuleViolation, Segment
 
 
 def apply_output_rules(segments: list[Segment], rules: OutputRules) -> list[Segment]:
     # TODO: implement line breaking, duration constraints, and reading speed checks.
     _ = rules
     return segments
+
+
+def _reading_chars(text: str) -> int:
+    # Line breaks and runs of whitespace are not read aloud; count them once.
+    return len(" ".join(text.split()))
+
+
+def check_segment(index: int, segment: Segment, rules: OutputRules) -> list[RuleViolation]:
+    violations: list[RuleViolation] = []
+    duration_ms = segment.end_ms - segment.start_ms
+
+    if duration_ms < rules.min_duration_ms:
+        violations.append(
+            RuleViolation(
+                index=index,
+                rule="min_duration",
+                value=duration_ms,
+                limit=rules.min_duration_ms,
+                message=f"Duration {duration_ms}ms is below {rules.min_duration_ms}ms",
+            )
+        )
+    if duration_ms > rules.max_duration_ms:
+        violations.append(
+            RuleViolation(
+                index=index,
+                rule="max_duration",
+                value=duration_ms,
+                limit=rules.max_duration_ms,
+                message=f"Duration {duration_ms}ms exceeds {rules.max_duration_ms}ms",
+            )
+        )
+
+    if duration_ms > 0:
+        cps = _reading_chars(segment.text) / (duration_ms / 1000)
+        if cps > rules.max_reading_speed_cps:
+            violations.append(
+                RuleViolation(
+                    index=index,
+                    rule="reading_speed",
+                    value=round(cps, 2),
+                    limit=rules.max_reading_speed_cps,
+                    message=(
+                        f"Reading speed {cps:.1f} cps exceeds "
+                        f"{rules.max_reading_speed_cps} cps"
+                    ),
+                )
+            )
+
+    lines = segment.text.splitlines() or [""]
+    if len(lines) > rules.max_lines_per_caption:
+        violations.append(
+            RuleViolation(
+                index=index,
+                rule="line_count",
+                value=len(lines),
+                limit=rules.max_lines_per_caption,
+                message=(
+                    f"{len(lines)} lines exceed {rules.max_lines_per_caption} lines"
+                ),
+            )
+        )
+    for line in lines:
+        length = len(line.strip())
+        if length > rules.max_chars_per_line:
+            violations.append(
+                RuleViolation(
+                    index=index,
+                    rule="line_length",
+                    value=length,
+                    limit=rules.max_chars_per_line,
+                    message=(
+                        f"Line length {length} exceeds {rules.max_chars_per_line} chars"
+                    ),
+                )
+            )
+
+    return violations
+
+
+def check_output_rules(segments: list[Segment], rules: OutputRules) -> list[RuleViolation]:
+    violations: list[RuleViolation] = []
+    previous: Segment | None = None
+    for idx, segment in enumerate(segments):
+        violations.extend(check_segment(idx, segment, rules))
+        if previous is not None:
+            gap_ms = segment.start_ms - previous.end_ms
+            if gap_ms < 0:
+                violations.append(
+                    RuleViolation(
+                        index=idx,
+                        rule="overlap",
+                        value=-gap_ms,
+                        limit=0,
+                        message=f"Overlaps previous cue by {-gap_ms}ms",
+                    )
+                )
+            elif gap_ms < rules.min_gap_ms:
+                violations.append(
+                    RuleViolation(
+                        index=idx,
+                        rule="gap",
+                        value=gap_ms,
+                        limit=rules.min_gap_ms,
+                        message=(
+                            f"Gap of {gap_ms}ms to previous cue is below "
+                            f"{rules.min_gap_ms}ms"
+                        ),
+                    )
+                )
+        previous = segment
+    return violations
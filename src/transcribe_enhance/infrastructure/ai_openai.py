@@ -4,11 +4,10 @@ import html
 import json
 import logging
 import os
-from typing import Any
-
-from openai import OpenAI
+from typing import Any, Callable
 
 from transcribe_enhance.domain.models import Instructions, Segment
+from transcribe_enhance.domain.retrieval import details_index
 
 
 _SYSTEM_PROMPT = (
@@ -19,13 +18,22 @@ _SYSTEM_PROMPT = (
 _logger = logging.getLogger("transcribe_enhance.ai_openai")
 
 
+def _select_details(segments: list[Segment], instructions: Instructions) -> str:
+    details = instructions.context.details
+    retrieval = instructions.ai.retrieval
+    if retrieval is None or not details:
+        return details
+    query = " ".join(segment.text for segment in segments)
+    return details_index(details).select(query, retrieval.top_k, retrieval.max_tokens)
+
+
 def _build_user_payload(segments: list[Segment], instructions: Instructions) -> dict[str, Any]:
-    return {
+    payload = {
         "context": {
             "purpose": instructions.context.purpose,
             "audience": instructions.context.audience,
             "tone": instructions.context.tone,
-            "details": instructions.context.details,
+            "details": _select_details(segments, instructions),
         },
         "output_rules": {
             "max_chars_per_line": instructions.output_rules.max_chars_per_line,
@@ -49,6 +57,10 @@ def _build_user_payload(segments: list[Segment], instructions: Instructions) ->
             for idx, segment in enumerate(segments)
         ],
     }
+    if instructions.glossary is not None:
+        # Already applied locally; listed so the model keeps the same spellings.
+        payload["glossary"] = list(instructions.glossary.terms)
+    return payload
 
 
 def _extract_output_text(response: Any) -> str:
@@ -65,70 +77,112 @@ def _extract_output_text(response: Any) -> str:
     raise ValueError("Unable to extract text from OpenAI response")
 
 
-def enhance_segments_openai(
-    segments: list[Segment],
-    instructions: Instructions,
-) -> list[Segment]:
+def _response_schema(segment_count: int, with_confidence: bool) -> dict[str, Any]:
+    item_properties: dict[str, Any] = {
+        "id": {"type": "integer"},
+        "text": {"type": "string"},
+    }
+    if with_confidence:
+        item_properties["confidence"] = {"type": "number"}
+    return {
+        "type": "object",
+        "properties": {
+            "segment_count": {"type": "integer"},
+            "segments": {
+                "type": "array",
+                "minItems": segment_count,
+                "maxItems": segment_count,
+                "items": {
+                    "type": "object",
+                    "properties": item_properties,
+                    "required": list(item_properties),
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["segment_count", "segments"],
+        "additionalProperties": False,
+    }
+
+
+def _translation_note(language: str) -> str:
+    return (
+        f"Translate the text of every segment into {language}. Keep one output "
+        "segment per input segment with the same id, and apply the output rules "
+        "to the translation."
+    )
+
+
+def create_client() -> Any:
     if not os.getenv("OPENAI_API_KEY"):
         raise EnvironmentError("OPENAI_API_KEY is required to use OpenAI integration")
 
-    client = OpenAI()
+    # Imported lazily: the SDK pulls in httpx/pydantic and dominates CLI startup.
+    from openai import OpenAI
+
+    return OpenAI()
+
+
+def build_request_body(
+    segments: list[Segment],
+    instructions: Instructions,
+    model: str,
+    temperature: float,
+    with_confidence: bool = False,
+) -> dict[str, Any]:
+    """Return the ``responses.create`` arguments for one chunk."""
     payload = _build_user_payload(segments, instructions)
     _logger.info(
         "OpenAI request: model=%s segments=%s temperature=%s",
-        instructions.ai.model,
+        model,
         len(segments),
-        instructions.ai.temperature,
+        temperature,
     )
     _logger.debug("OpenAI payload: %s", json.dumps(payload, ensure_ascii=False))
 
-    response = client.responses.create(
-        model=instructions.ai.model,
-        input=[
-            {"role": "system", "content": _SYSTEM_PROMPT},
-            {
-                "role": "user",
-                "content": (
-                    "Return JSON only. The response MUST include the same number of "
-                    "segments as provided, and each segment must include the same id. "
-                    f"segment_count MUST be {len(segments)}.\\n\\n"
-                    + json.dumps(payload, ensure_ascii=False)
-                ),
-            },
-        ],
-        temperature=instructions.ai.temperature,
-        text={
+    confidence_note = (
+        "Each segment must also include a confidence between 0 and 1 for its text. "
+        if with_confidence
+        else ""
+    )
+    messages = [
+        {"role": "system", "content": _SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": (
+                "Return JSON only. The response MUST include the same number of "
+                "segments as provided, and each segment must include the same id. "
+                + confidence_note
+                + f"segment_count MUST be {len(segments)}.\\n\\n"
+                + json.dumps(payload, ensure_ascii=False)
+            ),
+        },
+    ]
+    target_language = instructions.ai.target_language
+    if target_language:
+        # Last, so every language of a chunk shares the same cacheable prefix.
+        messages.append({"role": "user", "content": _translation_note(target_language)})
+    return {
+        "model": model,
+        "input": messages,
+        "temperature": temperature,
+        "text": {
             "format": {
                 "type": "json_schema",
                 "name": "subtitle_segments",
                 "strict": True,
-                "schema": {
-                    "type": "object",
-                    "properties": {
-                        "segment_count": {"type": "integer"},
-                        "segments": {
-                            "type": "array",
-                            "minItems": len(segments),
-                            "maxItems": len(segments),
-                            "items": {
-                                "type": "object",
-                                "properties": {
-                                    "id": {"type": "integer"},
-                                    "text": {"type": "string"},
-                                },
-                                "required": ["id", "text"],
-                                "additionalProperties": False,
-                            },
-                        },
-                    },
-                    "required": ["segment_count", "segments"],
-                    "additionalProperties": False,
-                },
+                "schema": _response_schema(len(segments), with_confidence),
             }
         },
-    )
+    }
 
-    output_text = _extract_output_text(response)
+
+def parse_segments_output(
+    output_text: str,
+    segments: list[Segment],
+    with_confidence: bool = False,
+) -> tuple[list[Segment], list[float] | None]:
+    """Validate a model response against the request and build the segments."""
     _logger.info("OpenAI response length: %s", len(output_text))
     if os.getenv("OPENAI_LOG_FULL") == "1":
         _logger.debug("OpenAI response: %s", output_text)
@@ -153,12 +207,21 @@ def enhance_segments_openai(
         )
         _logger.error("OpenAI response JSON: %s", output_text)
         raise ValueError("AI response did not return the expected number of segments")
+    if [item.get("id") for item in items] != list(range(expected)):
+        _logger.error("OpenAI response JSON: %s", output_text)
+        raise ValueError("AI response segment ids do not match the request")
 
     updated: list[Segment] = []
+    confidences: list[float] = []
     for segment, item in zip(segments, items, strict=True):
         text = item.get("text")
         if not isinstance(text, str):
             raise ValueError("AI response item missing 'text'")
+        if with_confidence:
+            confidence = item.get("confidence")
+            if not isinstance(confidence, (int, float)):
+                raise ValueError("AI response item missing 'confidence'")
+            confidences.append(float(confidence))
         cleaned = html.unescape(text).strip()
         updated.append(
             Segment(
@@ -168,4 +231,45 @@ def enhance_segments_openai(
             )
         )
 
-    return updated
+    return updated, (confidences if with_confidence else None)
+
+
+def request_segments_openai(
+    client: Any,
+    segments: list[Segment],
+    instructions: Instructions,
+    model: str,
+    temperature: float,
+    with_confidence: bool = False,
+) -> tuple[list[Segment], list[float] | None]:
+    """Send one request for ``segments`` and return the validated result.
+
+    When ``with_confidence`` is set the model also reports a 0-1 confidence per
+    segment, returned alongside the segments; otherwise confidences are None.
+    """
+    body = build_request_body(segments, instructions, model, temperature, with_confidence)
+    response = client.responses.create(**body)
+    return parse_segments_output(_extract_output_text(response), segments, with_confidence)
+
+
+def make_openai_tier(
+    instructions: Instructions,
+    model: str,
+    temperature: float,
+    with_confidence: bool = False,
+) -> Callable[[list[Segment]], tuple[list[Segment], list[float] | None]]:
+    """Return a callable that enhances one chunk with ``model``.
+
+    The client is created on first use and shared across chunks.
+    """
+    client: Any = None
+
+    def _tier(chunk: list[Segment]) -> tuple[list[Segment], list[float] | None]:
+        nonlocal client
+        if client is None:
+            client = create_client()
+        return request_segments_openai(
+            client, chunk, instructions, model, temperature, with_confidence
+        )
+
+    return _tier
@@ -0,0 +1,104 @@
+"""OpenAI Batch API adapter for offline bulk enhancement."""
+
+import json
+import logging
+from pathlib import Path
+import time
+from typing import Any
+
+from transcribe_enhance.domain.models import Instructions, Segment
+from transcribe_enhance.infrastructure.ai_openai import build_request_body
+
+
+_ENDPOINT = "/v1/responses"
+_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+_logger = logging.getLogger("transcribe_enhance.ai_openai_batch")
+
+
+def write_batch_file(
+    path: Path,
+    requests: list[tuple[str, list[Segment]]],
+    instructions: Instructions,
+) -> None:
+    """Serialize ``(custom_id, chunk)`` requests as a Batch API JSONL file."""
+    with path.open("w", encoding="utf-8") as handle:
+        for custom_id, chunk in requests:
+            body = build_request_body(
+                chunk, instructions, instructions.ai.model, instructions.ai.temperature
+            )
+            line = {"custom_id": custom_id, "method": "POST", "url": _ENDPOINT, "body": body}
+            handle.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+
+def submit_batch(client: Any, path: Path) -> str:
+    with path.open("rb") as handle:
+        uploaded = client.files.create(file=handle, purpose="batch")
+    batch = client.batches.create(
+        input_file_id=uploaded.id,
+        endpoint=_ENDPOINT,
+        completion_window="24h",
+    )
+    _logger.info("Submitted batch %s from %s", batch.id, path)
+    return batch.id
+
+
+def _output_text(body: dict[str, Any]) -> str:
+    # Raw Responses API JSON has no ``output_text`` convenience field.
+    for item in body.get("output", []):
+        for content in item.get("content", []) or []:
+            if content.get("type") == "output_text" and content.get("text"):
+                return content["text"]
+    raise ValueError("Unable to extract text from batch response body")
+
+
+def _read_results(client: Any, file_id: str | None) -> dict[str, str | None]:
+    results: dict[str, str | None] = {}
+    if not file_id:
+        return results
+    for raw in client.files.content(file_id).text.splitlines():
+        if not raw.strip():
+            continue
+        line = json.loads(raw)
+        custom_id = line["custom_id"]
+        response = line.get("response") or {}
+        if line.get("error") or response.get("status_code") != 200:
+            _logger.error(
+                "Batch request %s failed: %s", custom_id, line.get("error") or response
+            )
+            results[custom_id] = None
+            continue
+        try:
+            results[custom_id] = _output_text(response.get("body") or {})
+        except ValueError as exc:
+            _logger.error("Batch request %s: %s", custom_id, exc)
+            results[custom_id] = None
+    return results
+
+
+def wait_for_batch(
+    client: Any,
+    batch_id: str,
+    poll_interval_s: float,
+) -> tuple[str, dict[str, str | None]]:
+    """Poll until the batch finishes; return its final status and the output
+    text (or None) by custom_id.
+
+    Requests missing from the output (e.g. after expiry) are simply absent.
+    """
+    while True:
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in _TERMINAL_STATUSES:
+            break
+        _logger.info(
+            "Batch %s is %s; polling again in %ss", batch_id, batch.status, poll_interval_s
+        )
+        time.sleep(poll_interval_s)
+
+    _logger.info("Batch %s finished with status %s", batch_id, batch.status)
+    results = _read_results(client, batch.output_file_id)
+    results.update(
+        (custom_id, None)
+        for custom_id in _read_results(client, getattr(batch, "error_file_id", None))
+    )
+    return batch.status, results
@@ -0,0 +1,44 @@
+"""Persist the cue deduplication index as JSON between runs."""
+
+
+import json
+import logging
+import os
+from pathlib import Path
+
+from transcribe_enhance.domain.dedup import DedupIndex
+
+
+_logger = logging.getLogger("transcribe_enhance.dedup_store")
+
+
+def load_dedup_index(path: Path | None, threshold: float, fingerprint: str) -> DedupIndex:
+    """Load saved results; an index written under other instructions is ignored."""
+    index = DedupIndex(threshold)
+    if path is None or not path.exists():
+        return index
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if data.get("fingerprint") != fingerprint:
+        _logger.info("Ignoring dedup index written with other instructions: %s", path)
+        return index
+    for entry in data.get("entries", []):
+        index.add(entry["text"], entry["result"])
+    return index
+
+
+def save_dedup_index(path: Path, index: DedupIndex, fingerprint: str) -> None:
+    entries = [
+        {"text": entry.text, "result": entry.result}
+        for entry in index.entries
+        if entry.result is not None
+    ]
+    # Write then rename so a crash never leaves a truncated index behind.
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(
+        json.dumps(
+            {"version": 2, "fingerprint": fingerprint, "entries": entries},
+            ensure_ascii=False,
+        ),
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, path)
@@ -93,6 +93,26 @@ def _parse_frame_rate(root: ET.Element) -> float | None:
     return frame_rate
 
 
+def caption_lines(elem: ET.Element) -> list[str]:
+    """Displayed lines of a ``<p>``: split at ``<br/>``, source whitespace collapsed."""
+    lines: list[list[str]] = [[]]
+
+    def _walk(node: ET.Element) -> None:
+        if node.text:
+            lines[-1].append(node.text)
+        for child in node:
+            if child.tag.rsplit("}", 1)[-1] == "br":
+                lines.append([])
+            else:
+                _walk(child)
+            if child.tail:
+                lines[-1].append(child.tail)
+
+    _walk(elem)
+    joined = (" ".join("".join(parts).split()) for parts in lines)
+    return [line for line in joined if line]
+
+
 def parse_itt(path: Path) -> ParsedItt:
     namespaces: dict[str, str] = {}
     for event, data in ET.iterparse(path, events=("start-ns",)):
@@ -1,9 +1,9 @@
 """Patch iTT (TTML) while preserving original formatting."""
 
 
+import html
 from pathlib import Path
 import re
-from xml.sax.saxutils import escape
 
 from transcribe_enhance.domain.models import Segment
 from transcribe_enhance.infrastructure.itt_parser import ParsedItt
@@ -41,15 +41,29 @@ def _replace_attr(tag: str, name: str, value: str) -> str:
     return tag
 
 
-def _patch_itt_text(original_text: str, parsed: ParsedItt, segments: list[Segment]) -> str:
-    pattern = re.compile(
-        r'(?P<open><(?P<prefix>\w+:)?p\b[^>]*>)'
-        r'(?P<inner>.*?)'
-        r'(?P<close></(?(prefix)(?P=prefix))p>)',
-        re.DOTALL,
-    )
+_P_PATTERN = re.compile(
+    r'(?P<open><(?P<prefix>\w+:)?p\b[^>]*>)'
+    r'(?P<inner>.*?)'
+    r'(?P<close></(?(prefix)(?P=prefix))p>)',
+    re.DOTALL,
+)
 
-    matches = list(pattern.finditer(original_text))
+
+_TT_OPEN_PATTERN = re.compile(r"<(?:\w+:)?tt\b[^>]*>")
+
+
+def index_paragraphs(original_text: str) -> list[re.Match[str]]:
+    """Locate every ``<p>`` element; reusable when patching several outputs."""
+    return list(_P_PATTERN.finditer(original_text))
+
+
+def _patch_itt_text(
+    original_text: str,
+    parsed: ParsedItt,
+    segments: list[Segment],
+    spans: list[re.Match[str]] | None = None,
+) -> str:
+    matches = spans if spans is not None else index_paragraphs(original_text)
     if len(matches) != len(segments):
         raise ValueError(
             "Segment count does not match original iTT structure. "
@@ -82,7 +96,9 @@ def _patch_itt_text(original_text: str, parsed: ParsedItt, segments: list[Segmen
         new_open = _replace_attr(new_open, "end", end)
 
         if text_changed:
-            new_inner = escape(segment.text)
+            # html.escape(quote=False) matches xml.sax.saxutils.escape without
+            # importing urllib/http.client at startup.
+            new_inner = html.escape(segment.text, quote=False)
         else:
             new_inner = inner
 
@@ -96,11 +112,32 @@ def _patch_itt_text(original_text: str, parsed: ParsedItt, segments: list[Segmen
     return "".join(parts)
 
 
+def _set_document_language(text: str, language: str) -> str:
+    match = _TT_OPEN_PATTERN.search(text)
+    if match is None:
+        return text
+    tag = match.group(0)
+    value = html.escape(language)
+    if re.search(r"\sxml:lang=", tag):
+        tag = _replace_attr(tag, "xml:lang", value)
+    else:
+        tag = f'{tag[:-1]} xml:lang="{value}">'
+    return text[: match.start()] + tag + text[match.end() :]
+
+
 def write_itt(
     path: Path,
     original_text: str,
     parsed: ParsedItt,
     segments: list[Segment],
+    spans: list[re.Match[str]] | None = None,
+    language: str | None = None,
 ) -> None:
-    patched = _patch_itt_text(original_text, parsed, segments)
+    """Patch changed cues into ``original_text`` and write it to ``path``.
+
+    ``language`` replaces the document's ``xml:lang`` (for translated tracks).
+    """
+    patched = _patch_itt_text(original_text, parsed, segments, spans)
+    if language is not None:
+        patched = _set_document_language(patched, language)
     path.write_text(patched, encoding="utf-8")
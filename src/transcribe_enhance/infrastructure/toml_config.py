@@ -4,7 +4,17 @@
 from pathlib import Path
 import tomllib
 
-from transcribe_enhance.domain.models import AIConfig, Context, Instructions, OutputRules
+from transcribe_enhance.domain.models import (
+    AIConfig,
+    CascadeConfig,
+    Context,
+    DedupConfig,
+    GlossaryConfig,
+    Instructions,
+    OutputRules,
+    RetrievalConfig,
+    TargetsConfig,
+)
 
 
 DEFAULT_OUTPUT_RULES = OutputRules(
@@ -17,10 +27,20 @@ DEFAULT_OUTPUT_RULES = OutputRules(
     casing="sentence",
     punctuation="standard",
     profanity_policy="mask",
+    min_gap_ms=0,
 )
 
 
-DEFAULT_AI = AIConfig(provider="openai", model="gpt-4.1", temperature=0.2)
+DEFAULT_AI = AIConfig(
+    provider="openai",
+    model="gpt-4.1",
+    temperature=0.2,
+    max_edit_ratio=1.0,
+    chunk_size=0,
+)
+
+
+DEFAULT_CASCADE_MODEL = "gpt-4.1-mini"
 
 
 def _load_details(details_path: Path) -> str:
@@ -29,6 +49,47 @@ def _load_details(details_path: Path) -> str:
     return details_path.read_text(encoding="utf-8").strip()
 
 
+def _load_cascade(cascade_raw: dict, temperature: float) -> CascadeConfig:
+    return CascadeConfig(
+        model=cascade_raw.get("model", DEFAULT_CASCADE_MODEL),
+        temperature=cascade_raw.get("temperature", temperature),
+        min_confidence=cascade_raw.get("min_confidence", 0.0),
+        max_edit_ratio=cascade_raw.get("max_edit_ratio", 1.0),
+    )
+
+
+def _load_retrieval(retrieval_raw: dict) -> RetrievalConfig:
+    return RetrievalConfig(
+        top_k=retrieval_raw.get("top_k", 4),
+        max_tokens=retrieval_raw.get("max_tokens", 800),
+    )
+
+
+def _load_glossary(glossary_raw: dict) -> GlossaryConfig:
+    terms = glossary_raw.get("terms", {})
+    return GlossaryConfig(
+        terms={term: tuple(variants) for term, variants in terms.items()},
+        fuzzy=glossary_raw.get("fuzzy", False),
+        skip_ai_for_corrected=glossary_raw.get("skip_ai_for_corrected", False),
+        fuzzy_exclude=tuple(glossary_raw.get("fuzzy_exclude", [])),
+    )
+
+
+def _load_dedup(dedup_raw: dict) -> DedupConfig:
+    return DedupConfig(
+        threshold=dedup_raw.get("threshold", 0.85),
+        min_chars=dedup_raw.get("min_chars", 20),
+    )
+
+
+def _load_targets(targets_raw: dict) -> TargetsConfig:
+    source_language = targets_raw.get("source_language", "en")
+    languages = tuple(dict.fromkeys(targets_raw.get("languages", [source_language])))
+    if not languages:
+        raise ValueError("[targets] languages must list at least one language")
+    return TargetsConfig(source_language=source_language, languages=languages)
+
+
 def load_instructions(path: Path) -> Instructions:
     data = tomllib.loads(path.read_text(encoding="utf-8"))
 
@@ -75,12 +136,44 @@ def load_instructions(path: Path) -> Instructions:
         profanity_policy=output_raw.get(
             "profanity_policy", DEFAULT_OUTPUT_RULES.profanity_policy
         ),
+        min_gap_ms=output_raw.get("min_gap_ms", DEFAULT_OUTPUT_RULES.min_gap_ms),
     )
 
+    temperature = ai_raw.get("temperature", DEFAULT_AI.temperature)
+    cascade = None
+    if "cascade" in ai_raw:
+        cascade = _load_cascade(ai_raw["cascade"], temperature)
+    retrieval = None
+    if "retrieval" in ai_raw:
+        retrieval = _load_retrieval(ai_raw["retrieval"])
+
     ai = AIConfig(
         provider=ai_raw.get("provider", DEFAULT_AI.provider),
         model=ai_raw.get("model", DEFAULT_AI.model),
-        temperature=ai_raw.get("temperature", DEFAULT_AI.temperature),
+        temperature=temperature,
+        max_edit_ratio=ai_raw.get("max_edit_ratio", DEFAULT_AI.max_edit_ratio),
+        chunk_size=ai_raw.get("chunk_size", DEFAULT_AI.chunk_size),
+        cascade=cascade,
+        retrieval=retrieval,
     )
 
-    return Instructions(context=context, output_rules=output_rules, ai=ai)
+    glossary = None
+    if "glossary" in data:
+        glossary = _load_glossary(data["glossary"])
+
+    dedup = None
+    if "dedup" in data:
+        dedup = _load_dedup(data["dedup"])
+
+    targets = None
+    if "targets" in data:
+        targets = _load_targets(data["targets"])
+
+    return Instructions(
+        context=context,
+        output_rules=output_rules,
+        ai=ai,
+        glossary=glossary,
+        dedup=dedup,
+        targets=targets,
+    )
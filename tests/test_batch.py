@@ -0,0 +1,212 @@
+import json
+from email.parser import BytesParser
+from email.policy import default as default_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import threading
+
+import pytest
+
+from transcribe_enhance.application.batch import batch_inputs, run_batch
+from transcribe_enhance.infrastructure.toml_config import load_instructions
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "sample.itt"
+FAILING_ID = "f1-c0"
+
+
+class _StandInBatchServer(ThreadingHTTPServer):
+    """Minimal local stand-in for the OpenAI Files and Batches endpoints.
+
+    Each request is "processed" by upper-casing its segment texts; the request
+    with ``FAILING_ID`` returns a server error.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.input_lines: list[dict] = []
+        self.polls = 0
+        self.final_status = "completed"
+
+    def output_jsonl(self) -> str:
+        lines = []
+        for line in self.input_lines:
+            if line["custom_id"] == FAILING_ID:
+                response = {"status_code": 500, "request_id": "req", "body": {}}
+            else:
+                content = line["body"]["input"][1]["content"]
+                payload = json.loads(content[content.index("{") :])
+                result = {
+                    "segment_count": payload["segment_count"],
+                    "segments": [
+                        {"id": item["id"], "text": item["text"].upper()}
+                        for item in payload["segments"]
+                    ],
+                }
+                response = {
+                    "status_code": 200,
+                    "request_id": "req",
+                    "body": {
+                        "output": [
+                            {
+                                "type": "message",
+                                "content": [
+                                    {"type": "output_text", "text": json.dumps(result)}
+                                ],
+                            }
+                        ]
+                    },
+                }
+            lines.append(
+                json.dumps({"id": "out", "custom_id": line["custom_id"], "response": response})
+            )
+        return "\n".join(lines) + "\n"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _StandInBatchServer
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _send(self, body: dict | str, content_type: str = "application/json") -> None:
+        data = (body if isinstance(body, str) else json.dumps(body)).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _batch(self, status: str) -> dict:
+        batch = {
+            "id": "batch_1",
+            "object": "batch",
+            "endpoint": "/v1/responses",
+            "input_file_id": "file-in",
+            "completion_window": "24h",
+            "status": status,
+            "created_at": 0,
+        }
+        if status == "completed":
+            batch["output_file_id"] = "file-out"
+        return batch
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.path == "/v1/files":
+            header = f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode()
+            message = BytesParser(policy=default_policy).parsebytes(header + body)
+            for part in message.iter_parts():
+                if part.get_param("name", header="content-disposition") == "file":
+                    content = part.get_payload(decode=True).decode("utf-8")
+                    self.server.input_lines = [json.loads(raw) for raw in content.splitlines()]
+            self._send(
+                {
+                    "id": "file-in",
+                    "object": "file",
+                    "bytes": len(body),
+                    "created_at": 0,
+                    "filename": "batch.jsonl",
+                    "purpose": "batch",
+                    "status": "processed",
+                }
+            )
+        elif self.path == "/v1/batches":
+            self._send(self._batch("validating"))
+        else:
+            self.send_error(404)
+
+    def do_GET(self) -> None:
+        if self.path == "/v1/batches/batch_1":
+            self.server.polls += 1
+            status = "in_progress" if self.server.polls == 1 else self.server.final_status
+            self._send(self._batch(status))
+        elif self.path == "/v1/files/file-out/content":
+            self._send(self.server.output_jsonl(), content_type="application/jsonl")
+        else:
+            self.send_error(404)
+
+
+@pytest.fixture
+def batch_server(monkeypatch):
+    server = _StandInBatchServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/v1")
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_batch_round_trip_against_stand_in_server(tmp_path: Path, batch_server) -> None:
+    pytest.importorskip("openai")
+    config = tmp_path / "instructions.toml"
+    config.write_text("[ai]\nchunk_size = 1\n", encoding="utf-8")
+    inputs = tmp_path / "inputs"
+    inputs.mkdir()
+    (inputs / "a.itt").write_bytes(FIXTURE.read_bytes())
+    (inputs / "b.itt").write_bytes(FIXTURE.read_bytes())
+    out_dir = tmp_path / "out"
+
+    with pytest.raises(RuntimeError, match="1 of 4 request"):
+        run_batch(
+            paths=[inputs / "a.itt", inputs / "b.itt"],
+            out_dir=out_dir,
+            instructions=load_instructions(config),
+            batch_file=tmp_path / "batch.jsonl",
+            poll_interval_s=0,
+        )
+
+    batch_lines = (tmp_path / "batch.jsonl").read_text(encoding="utf-8").splitlines()
+    submitted = [json.loads(raw) for raw in batch_lines]
+    assert [line["custom_id"] for line in submitted] == ["f0-c0", "f0-c1", "f1-c0", "f1-c1"]
+    assert batch_server.input_lines == submitted
+    assert batch_server.polls == 2
+
+    first = (out_dir / "a.itt").read_text(encoding="utf-8")
+    assert "ALPHA UNIQUE_TEXT_ONE" in first
+    assert "BRAVO UNIQUE_TEXT_TWO" in first
+
+    # The failed request leaves its cue untouched; the rest of the file is patched.
+    second = (out_dir / "b.itt").read_text(encoding="utf-8")
+    assert "Alpha UNIQUE_TEXT_ONE" in second
+    assert "BRAVO UNIQUE_TEXT_TWO" in second
+    assert (out_dir / "b.changes.txt").read_text(encoding="utf-8").count("Change ") == 1
+
+
+def test_failed_batch_writes_nothing(tmp_path: Path, batch_server) -> None:
+    pytest.importorskip("openai")
+    batch_server.final_status = "failed"
+    config = tmp_path / "instructions.toml"
+    config.write_text("[ai]\nchunk_size = 1\n", encoding="utf-8")
+    out_dir = tmp_path / "out"
+
+    with pytest.raises(RuntimeError, match="failed"):
+        run_batch(
+            paths=[FIXTURE],
+            out_dir=out_dir,
+            instructions=load_instructions(config),
+            batch_file=tmp_path / "batch.jsonl",
+            poll_interval_s=0,
+        )
+
+    assert not (out_dir / "sample.itt").exists()
+
+
+def test_batch_inputs_mirror_scanned_directories(tmp_path: Path) -> None:
+    episodes = tmp_path / "episodes"
+    for season in ("season1", "season2"):
+        (episodes / season).mkdir(parents=True)
+        (episodes / season / "ep01.itt").write_bytes(FIXTURE.read_bytes())
+    out_dir = tmp_path / "out"
+
+    assert batch_inputs([episodes], out_dir) == [
+        (episodes / "season1" / "ep01.itt", out_dir / "season1" / "ep01.itt"),
+        (episodes / "season2" / "ep01.itt", out_dir / "season2" / "ep01.itt"),
+    ]
+    with pytest.raises(ValueError, match="both be written"):
+        batch_inputs(
+            [episodes / "season1" / "ep01.itt", episodes / "season2" / "ep01.itt"],
+            out_dir,
+        )
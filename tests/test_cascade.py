@@ -0,0 +1,201 @@
+import json
+from dataclasses import replace
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from transcribe_enhance.application.cascade import run_cascade
+from transcribe_enhance.application.pipeline import run_pipeline
+from transcribe_enhance.domain.models import CascadeConfig, Instructions, Segment
+from transcribe_enhance.infrastructure import ai_openai
+from transcribe_enhance.infrastructure.ai_openai import request_segments_openai
+from transcribe_enhance.infrastructure.toml_config import (
+    DEFAULT_OUTPUT_RULES,
+    load_instructions,
+)
+
+
+CASCADE = CascadeConfig(
+    model="cheap-model",
+    temperature=0.2,
+    min_confidence=0.6,
+    max_edit_ratio=0.5,
+)
+
+
+def _segments() -> list[Segment]:
+    return [
+        Segment(start_ms=idx * 2000, end_ms=idx * 2000 + 1500, text=f"cue number {idx}")
+        for idx in range(6)
+    ]
+
+
+def _cheap(chunk: list[Segment]) -> tuple[list[Segment], list[float] | None]:
+    first = chunk[0].text
+    if first.endswith("0"):
+        # Small fix, confident: accepted.
+        return [replace(s, text=s.text.replace("cue", "Cue")) for s in chunk], [0.9] * len(chunk)
+    if first.endswith("2"):
+        # Confident but rewrites everything: rejected on edit ratio.
+        return [replace(s, text="totally different words") for s in chunk], [0.9] * len(chunk)
+    # Unchanged but unsure: rejected on confidence.
+    return list(chunk), [0.3] * len(chunk)
+
+
+def _strong(chunk: list[Segment]) -> tuple[list[Segment], list[float] | None]:
+    return [replace(s, text=s.text + ".") for s in chunk], None
+
+
+def test_cascade_escalates_only_rejected_chunks() -> None:
+    updated, stats = run_cascade(
+        _segments(),
+        DEFAULT_OUTPUT_RULES,
+        CASCADE,
+        chunk_size=2,
+        cheap=_cheap,
+        strong=_strong,
+        strong_model="strong-model",
+    )
+
+    assert [s.text for s in updated] == [
+        "Cue number 0",
+        "Cue number 1",
+        "cue number 2.",
+        "cue number 3.",
+        "cue number 4.",
+        "cue number 5.",
+    ]
+    cheap_stats, strong_stats = stats
+    assert cheap_stats.requests == 3
+    assert cheap_stats.accepted == 1
+    assert cheap_stats.hit_rate == pytest.approx(1 / 3)
+    assert cheap_stats.rejections == {"edit_ratio": 1, "confidence": 1}
+    assert strong_stats.requests == 2
+    assert strong_stats.accepted == 2
+    assert strong_stats.model == "strong-model"
+
+
+def test_cascade_strong_hit_rate_uses_same_checks() -> None:
+    def _rewriting(chunk: list[Segment]) -> tuple[list[Segment], list[float] | None]:
+        return [replace(s, text="totally different words") for s in chunk], None
+
+    updated, stats = run_cascade(
+        _segments(),
+        DEFAULT_OUTPUT_RULES,
+        CASCADE,
+        chunk_size=2,
+        cheap=_cheap,
+        strong=_rewriting,
+        strong_model="strong-model",
+    )
+
+    # Terminal tier output is kept, but it does not count as a hit.
+    assert updated[2].text == "totally different words"
+    assert stats[1].requests == 2
+    assert stats[1].hit_rate == 0.0
+    assert stats[1].rejections == {"edit_ratio": 2}
+
+
+def test_cascade_escalates_invalid_cheap_response() -> None:
+    def _broken(chunk: list[Segment]) -> tuple[list[Segment], list[float] | None]:
+        raise ValueError("AI response segment ids do not match the request")
+
+    updated, stats = run_cascade(
+        _segments(),
+        DEFAULT_OUTPUT_RULES,
+        CASCADE,
+        chunk_size=0,
+        cheap=_broken,
+        strong=_strong,
+        strong_model="strong-model",
+    )
+
+    assert all(s.text.endswith(".") for s in updated)
+    assert stats[0].rejections == {"invalid_response": 1}
+    assert stats[1].requests == 1
+
+
+def test_pipeline_logs_one_cascade_report_across_dedup_passes(
+    tmp_path: Path, monkeypatch, caplog
+) -> None:
+    config = tmp_path / "instructions.toml"
+    config.write_text(
+        '[ai.cascade]\nmodel = "cheap-model"\n[dedup]\nthreshold = 0.5\nmin_chars = 10\n',
+        encoding="utf-8",
+    )
+    source = tmp_path / "input.itt"
+    # The second cue is a near duplicate whose differing word is edited, so
+    # dedup sends it again in a second pass.
+    source.write_text(
+        '<?xml version="1.0"?>\n'
+        '<tt xmlns="http://www.w3.org/ns/ttml" xmlns:ttp="http://www.w3.org/ns/ttml#parameter"'
+        ' ttp:timeBase="smpte" ttp:frameRate="30"><body><div>\n'
+        '<p begin="00:00:01:00" end="00:00:03:00">we set up continous builds today</p>\n'
+        '<p begin="00:00:04:00" end="00:00:06:00">we set up continous build today</p>\n'
+        "</div></body></tt>\n",
+        encoding="utf-8",
+    )
+
+    def _tier(chunk: list[Segment]) -> tuple[list[Segment], list[float]]:
+        fixed = [replace(s, text=s.text.replace("continous", "continuous")) for s in chunk]
+        return fixed, [0.9] * len(chunk)
+
+    monkeypatch.setattr(ai_openai, "make_openai_tier", lambda *args, **kwargs: _tier)
+
+    with caplog.at_level(logging.INFO, logger="transcribe_enhance"):
+        run_pipeline(
+            audio_path=tmp_path / "audio.m4a",
+            itt_path=source,
+            instructions=load_instructions(config),
+            output_path=tmp_path / "out.itt",
+            allow_timing_adjust=True,
+            enable_ai=True,
+        )
+
+    reports = [r.getMessage() for r in caplog.records if "Cascade tier cheap" in r.getMessage()]
+    assert len(reports) == 1
+    assert "requests=2 hit_rate=1.00" in reports[0]
+
+
+def test_request_segments_rejects_mismatched_ids() -> None:
+    response = SimpleNamespace(
+        output_text=json.dumps(
+            {
+                "segment_count": 2,
+                "segments": [{"id": 1, "text": "a"}, {"id": 0, "text": "b"}],
+            }
+        )
+    )
+    client = SimpleNamespace(responses=SimpleNamespace(create=lambda **_: response))
+    instructions = load_instructions(
+        Path(__file__).parent.parent / "demo_files" / "instructions.toml"
+    )
+
+    with pytest.raises(ValueError, match="ids"):
+        request_segments_openai(client, _segments()[:2], instructions, "model", 0.2)
+
+
+def test_load_instructions_reads_cascade_table(tmp_path: Path) -> None:
+    config = tmp_path / "instructions.toml"
+    config.write_text(
+        "[ai]\n"
+        'model = "gpt-4.1"\n'
+        "temperature = 0.3\n"
+        "chunk_size = 25\n"
+        "[ai.cascade]\n"
+        'model = "gpt-4.1-mini"\n'
+        "min_confidence = 0.7\n",
+        encoding="utf-8",
+    )
+
+    instructions: Instructions = load_instructions(config)
+
+    assert instructions.ai.chunk_size == 25
+    assert instructions.ai.cascade == CascadeConfig(
+        model="gpt-4.1-mini",
+        temperature=0.3,
+        min_confidence=0.7,
+        max_edit_ratio=1.0,
+    )
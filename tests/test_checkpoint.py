@@ -0,0 +1,101 @@
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from transcribe_enhance.application.checkpoint import CheckpointJournal, checkpoint_path
+from transcribe_enhance.application.pipeline import run_pipeline
+from transcribe_enhance.domain.models import Instructions, Segment
+from transcribe_enhance.infrastructure import ai_openai
+from transcribe_enhance.infrastructure.toml_config import load_instructions
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "sample.itt"
+_HELLO = Segment(start_ms=0, end_ms=1000, text="Hello")
+_WORLD = Segment(start_ms=1000, end_ms=2000, text="World")
+
+
+def _instructions(tmp_path: Path) -> Instructions:
+    config = tmp_path / "instructions.toml"
+    config.write_text("[ai]\nchunk_size = 1\n", encoding="utf-8")
+    return load_instructions(config)
+
+
+class _Tier:
+    def __init__(self, fail_on_call: int | None = None) -> None:
+        self.calls = 0
+        self.fail_on_call = fail_on_call
+
+    def __call__(self, chunk: list[Segment]) -> tuple[list[Segment], None]:
+        self.calls += 1
+        if self.calls == self.fail_on_call:
+            raise RuntimeError("worker preempted")
+        return [replace(segment, text=segment.text + " fixed") for segment in chunk], None
+
+
+def _run(tmp_path: Path, monkeypatch, tier: _Tier, resume: bool) -> Path:
+    monkeypatch.setattr(ai_openai, "make_openai_tier", lambda *args, **kwargs: tier)
+    output = tmp_path / "output.itt"
+    run_pipeline(
+        audio_path=tmp_path / "audio.m4a",
+        itt_path=FIXTURE,
+        instructions=_instructions(tmp_path),
+        output_path=output,
+        allow_timing_adjust=True,
+        enable_ai=True,
+        resume=resume,
+    )
+    return output
+
+
+def test_resume_skips_finished_chunks_and_files(tmp_path: Path, monkeypatch) -> None:
+    with pytest.raises(RuntimeError):
+        _run(tmp_path, monkeypatch, _Tier(fail_on_call=2), resume=False)
+
+    resumed = _Tier()
+    output = _run(tmp_path, monkeypatch, resumed, resume=True)
+
+    assert resumed.calls == 1
+    patched = output.read_text(encoding="utf-8")
+    assert "Alpha UNIQUE_TEXT_ONE fixed" in patched
+    assert "Bravo UNIQUE_TEXT_TWO fixed" in patched
+
+    finished = _Tier()
+    _run(tmp_path, monkeypatch, finished, resume=True)
+    assert finished.calls == 0
+
+
+def test_run_without_resume_starts_fresh(tmp_path: Path, monkeypatch) -> None:
+    _run(tmp_path, monkeypatch, _Tier(), resume=False)
+
+    rerun = _Tier()
+    _run(tmp_path, monkeypatch, rerun, resume=False)
+
+    assert rerun.calls == 2
+
+
+def test_journal_drops_torn_tail_and_foreign_fingerprint(tmp_path: Path) -> None:
+    path = checkpoint_path(tmp_path / "output.itt")
+    journal = CheckpointJournal(path, "abc")
+    journal.open(resume=False)
+    journal.record(0, [_HELLO], [_HELLO])
+    journal.close()
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"type": "chunk", "start": 1, "segm')
+
+    resumed = CheckpointJournal(path, "abc")
+    resumed.open(resume=True)
+    resumed.record(1, [_WORLD], [_WORLD])
+    resumed.close()
+
+    reloaded = CheckpointJournal(path, "abc")
+    reloaded.open(resume=True)
+    reloaded.close()
+    assert reloaded.completed_chunk(0, [_HELLO]) == [_HELLO]
+    assert reloaded.completed_chunk(1, [_WORLD]) == [_WORLD]
+    assert reloaded.completed_chunk(1, [_HELLO]) is None
+
+    foreign = CheckpointJournal(path, "other")
+    foreign.open(resume=True)
+    foreign.close()
+    assert foreign.completed_chunk(0, [_HELLO]) is None
@@ -0,0 +1,156 @@
+import json
+from dataclasses import replace
+from pathlib import Path
+
+from transcribe_enhance.application.pipeline import run_pipeline
+from transcribe_enhance.domain.dedup import DedupIndex
+from transcribe_enhance.domain.models import Segment
+from transcribe_enhance.infrastructure import ai_openai
+from transcribe_enhance.infrastructure.toml_config import load_instructions
+
+
+INTRO = "Welcome back to Voyager Quests, the show about clean code."
+OUTRO = "Thanks for watching, see you in the next episode."
+
+
+def _write_itt(path: Path, texts: list[str]) -> None:
+    paragraphs = "\n".join(
+        f'      <p begin="00:00:{idx * 3:02d}:00" end="00:00:{idx * 3 + 2:02d}:00">{text}</p>'
+        for idx, text in enumerate(texts)
+    )
+    path.write_text(
+        '<?xml version="1.0"?>\n'
+        '<tt xmlns="http://www.w3.org/ns/ttml" xmlns:ttp="http://www.w3.org/ns/ttml#parameter"'
+        ' ttp:timeBase="smpte" ttp:frameRate="30">\n'
+        "  <body>\n    <div>\n"
+        f"{paragraphs}\n"
+        "    </div>\n  </body>\n</tt>\n",
+        encoding="utf-8",
+    )
+
+
+def test_dedup_index_matches_exact_and_near_duplicates() -> None:
+    index = DedupIndex(threshold=0.8)
+    entry_id = index.add(INTRO)
+
+    assert index.match("welcome back to voyager quests the show about clean code") == entry_id
+    assert index.match("Welcome back to Voyager Quest, the show about clean code!") == entry_id
+    assert index.match(OUTRO) is None
+
+
+def _fix(text: str) -> str:
+    return text.replace("continous", "continuous").replace("clean code", "Clean Code")
+
+
+def test_pipeline_enhances_boilerplate_once_across_files(tmp_path: Path, monkeypatch) -> None:
+    config = tmp_path / "instructions.toml"
+    config.write_text("[dedup]\nthreshold = 0.8\nmin_chars = 20\n", encoding="utf-8")
+    instructions = load_instructions(config)
+    index_path = tmp_path / "season.dedup.json"
+    sent: list[str] = []
+
+    def _tier(chunk: list[Segment]) -> tuple[list[Segment], None]:
+        sent.extend(segment.text for segment in chunk)
+        return [replace(segment, text=_fix(segment.text)) for segment in chunk], None
+
+    monkeypatch.setattr(ai_openai, "make_openai_tier", lambda *args, **kwargs: _tier)
+
+    chapter = "Chapter {}: setting up continous integration for the backend service."
+    plural = "Chapter 12: setting up continous integrations for the backend service."
+    warning = "Do not run this continous job on the production database."
+    episodes = [
+        [INTRO, "Today we refactor the parser.", "Okay.", "Okay.", OUTRO, INTRO + "!"]
+        + [chapter.format(12), warning],
+        [INTRO, chapter.format(13), plural, OUTRO, warning.replace("Do not", "Do")],
+    ]
+    outputs = []
+    for number, texts in enumerate(episodes, start=1):
+        source = tmp_path / f"episode{number}.itt"
+        _write_itt(source, texts)
+        output = tmp_path / f"episode{number}.out.itt"
+        run_pipeline(
+            audio_path=tmp_path / "audio.m4a",
+            itt_path=source,
+            instructions=instructions,
+            output_path=output,
+            allow_timing_adjust=True,
+            enable_ai=True,
+            dedup_index_path=index_path,
+        )
+        outputs.append(output.read_text(encoding="utf-8"))
+
+    # The plural cue differs inside the edited span, so it is sent on its own.
+    assert sent == [
+        INTRO,
+        "Today we refactor the parser.",
+        "Okay.",
+        "Okay.",
+        OUTRO,
+        chapter.format(12),
+        warning,
+        plural,
+    ]
+    # Exact duplicates (up to case and punctuation) share the result.
+    assert outputs[0].count(_fix(INTRO)) == 2
+    assert _fix(INTRO) in outputs[1]
+    assert _fix(OUTRO) in outputs[1]
+    # Near duplicates keep their own words and only take the edits.
+    assert _fix(chapter.format(13)) in outputs[1]
+    assert _fix(plural) in outputs[1]
+    assert "Do run this continuous job on the production database." in outputs[1]
+    assert index_path.exists()
+
+
+def test_dedup_index_keeps_only_guarded_results_for_same_instructions(
+    tmp_path: Path, monkeypatch
+) -> None:
+    config = tmp_path / "instructions.toml"
+    config.write_text(
+        "[ai]\nmax_edit_ratio = 0.5\n[dedup]\nthreshold = 0.8\nmin_chars = 20\n",
+        encoding="utf-8",
+    )
+    index_path = tmp_path / "season.dedup.json"
+    source = tmp_path / "episode.itt"
+    _write_itt(source, [INTRO, OUTRO, INTRO, OUTRO])
+    sent: list[str] = []
+
+    def _tier(chunk: list[Segment]) -> tuple[list[Segment], None]:
+        sent.extend(segment.text for segment in chunk)
+        # The outro is rewritten wholesale, which max_edit_ratio reverts.
+        return [
+            replace(s, text="Bye." if s.text == OUTRO else _fix(s.text)) for s in chunk
+        ], None
+
+    monkeypatch.setattr(ai_openai, "make_openai_tier", lambda *args, **kwargs: _tier)
+
+    def _run(instructions_path: Path) -> str:
+        output = tmp_path / "out.itt"
+        run_pipeline(
+            audio_path=tmp_path / "audio.m4a",
+            itt_path=source,
+            instructions=load_instructions(instructions_path),
+            output_path=output,
+            allow_timing_adjust=True,
+            enable_ai=True,
+            dedup_index_path=index_path,
+        )
+        return output.read_text(encoding="utf-8")
+
+    first = _run(config)
+    # The rejected outro is neither stored nor fanned out to its duplicate.
+    assert sent == [INTRO, OUTRO, OUTRO]
+    assert first.count(_fix(INTRO)) == 2
+    assert first.count(OUTRO) == 2
+    saved = json.loads(index_path.read_text(encoding="utf-8"))
+    assert [entry["text"] for entry in saved["entries"]] == [INTRO]
+
+    sent.clear()
+    _run(config)
+    assert sent == [OUTRO, OUTRO]
+
+    # Other instructions must not reuse results produced under the old ones.
+    other = tmp_path / "other.toml"
+    other.write_text(config.read_text() + '[context]\naudience = "Developers"\n')
+    sent.clear()
+    _run(other)
+    assert sent == [INTRO, OUTRO, OUTRO]
@@ -0,0 +1,115 @@
+from dataclasses import replace
+from pathlib import Path
+
+from transcribe_enhance.application.pipeline import run_pipeline
+from transcribe_enhance.domain.diff import apply_word_edits, diff_words, format_word_diff
+from transcribe_enhance.domain.models import AIConfig, Context, Instructions, OutputRules, Segment
+from transcribe_enhance.infrastructure import ai_openai
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "sample.itt"
+
+
+def _instructions(max_edit_ratio: float) -> Instructions:
+    return Instructions(
+        context=Context(purpose="Test", audience="Test", tone="Neutral", details=""),
+        output_rules=OutputRules(
+            max_chars_per_line=42,
+            max_lines_per_caption=2,
+            max_reading_speed_cps=17,
+            min_duration_ms=700,
+            max_duration_ms=6000,
+            line_break_style="punctuation",
+            casing="sentence",
+            punctuation="standard",
+            profanity_policy="mask",
+        ),
+        ai=AIConfig(
+            provider="openai",
+            model="gpt-4.1",
+            temperature=0.2,
+            max_edit_ratio=max_edit_ratio,
+        ),
+    )
+
+
+def _lcs_length(a: list[str], b: list[str]) -> int:
+    table = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i, left in enumerate(a):
+        for j, right in enumerate(b):
+            if left == right:
+                table[i + 1][j + 1] = table[i][j] + 1
+            else:
+                table[i + 1][j + 1] = max(table[i][j + 1], table[i + 1][j])
+    return table[-1][-1]
+
+
+def test_diff_words_reports_minimal_edit_script() -> None:
+    diff = diff_words("We gonna quickly walk through", "We are going to quickly walk through")
+
+    assert format_word_diff(diff) == "We [-gonna-] {+are going to+} quickly walk through"
+    assert diff.distance == 4
+    assert diff.ratio == 4 / 12
+
+
+
+def test_apply_word_edits_replays_only_clean_edits() -> None:
+    before = "Chapter 12: setting up continous integration for the backend service."
+    after = "Chapter 12: setting up continuous integration for the backend service."
+
+    assert apply_word_edits(before, after, before.replace("12", "13")) == after.replace(
+        "12", "13"
+    )
+    # The edited word's neighbour differs in the target: no clean replay.
+    assert apply_word_edits(before, after, before.replace("integration", "CI")) is None
+    assert apply_word_edits("a b c", "a c", "a  b\nc") == "a  c"
+    assert apply_word_edits("a b", "a X b", "a\nb") == "a\nX b"
+
+def test_diff_words_is_optimal_and_reconstructs_both_sides() -> None:
+    cases = [
+        ("", ""),
+        ("a b c", ""),
+        ("", "a b c"),
+        ("a b c a b b a", "c b a b a c"),
+        ("the api return it back to use", "the API returns it back to us"),
+        ("x y z x y z x y z", "z y x z y x"),
+    ]
+    for before, after in cases:
+        a, b = before.split(), after.split()
+        diff = diff_words(before, after)
+
+        kept_before = [w for edit in diff.edits if edit.op != "insert" for w in edit.words]
+        kept_after = [w for edit in diff.edits if edit.op != "delete" for w in edit.words]
+        assert kept_before == a
+        assert kept_after == b
+        assert diff.distance == len(a) + len(b) - 2 * _lcs_length(a, b)
+
+
+def test_pipeline_reverts_edits_above_threshold(tmp_path: Path, monkeypatch) -> None:
+    def _fake_tier(segments: list[Segment]) -> tuple[list[Segment], None]:
+        return [
+            replace(segments[0], text="Alpha UNIQUE_TEXT_ONE fixed"),
+            replace(segments[1], text="Something else entirely"),
+        ], None
+
+    monkeypatch.setattr(ai_openai, "make_openai_tier", lambda *args, **kwargs: _fake_tier)
+    output = tmp_path / "output.itt"
+
+    run_pipeline(
+        audio_path=tmp_path / "audio.m4a",
+        itt_path=FIXTURE,
+        instructions=_instructions(max_edit_ratio=0.5),
+        output_path=output,
+        allow_timing_adjust=True,
+        enable_ai=True,
+    )
+
+    patched = output.read_text(encoding="utf-8")
+    assert "Alpha UNIQUE_TEXT_ONE fixed" in patched
+    assert "Bravo UNIQUE_TEXT_TWO" in patched
+    assert "Something else entirely" not in patched
+
+    changes = output.with_suffix(".changes.txt").read_text(encoding="utf-8")
+    assert "Diff: Alpha UNIQUE_TEXT_ONE {+fixed+}" in changes
+    assert "Rejected: Something else entirely" in changes
+    assert "Edit Ratio: 1.00 (exceeds 0.50, reverted)" in changes
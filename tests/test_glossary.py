@@ -0,0 +1,160 @@
+from dataclasses import replace
+from pathlib import Path
+
+from transcribe_enhance.application.pipeline import run_pipeline
+from transcribe_enhance.domain.glossary import Glossary
+from transcribe_enhance.domain.models import GlossaryConfig, Segment
+from transcribe_enhance.infrastructure import ai_openai
+from transcribe_enhance.infrastructure.toml_config import load_instructions
+
+
+def _glossary(fuzzy: bool = True) -> Glossary:
+    return Glossary.from_config(
+        GlossaryConfig(
+            terms={
+                "Gandalf the White": ("Gandalf the Wite",),
+                "API": (),
+                "FastAPI": ("fast api",),
+                "Pydantic": ("pedantic",),
+            },
+            fuzzy=fuzzy,
+            skip_ai_for_corrected=False,
+        )
+    )
+
+
+def test_glossary_corrects_terms_in_one_pass() -> None:
+    glossary = _glossary()
+
+    assert glossary.correct("Gandalf the Wite was creatd.") == (
+        "Gandalf the White was creatd.",
+        1,
+    )
+    assert glossary.correct("The api uses Fast API and pedantic.") == (
+        "The API uses FastAPI and Pydantic.",
+        3,
+    )
+
+
+def test_glossary_respects_word_boundaries_and_exact_matches() -> None:
+    glossary = _glossary()
+
+    assert glossary.correct("A rapid capital apiary.") == ("A rapid capital apiary.", 0)
+    assert glossary.correct("Use the API.") == ("Use the API.", 0)
+
+
+def test_glossary_fuzzy_variants_are_optional() -> None:
+    assert _glossary(fuzzy=True).correct("Pydnatic and Pydantc") == (
+        "Pydantic and Pydantic",
+        2,
+    )
+    assert _glossary(fuzzy=False).correct("Pydnatic") == ("Pydnatic", 0)
+
+
+def test_glossary_fuzzy_variants_skip_common_words(tmp_path: Path) -> None:
+    config = tmp_path / "instructions.toml"
+    config.write_text(
+        "[glossary]\n"
+        "fuzzy = true\n"
+        'fuzzy_exclude = ["stipe"]\n'
+        "[glossary.terms]\n"
+        "Swift = []\n"
+        "Slack = []\n"
+        "Stripe = []\n",
+        encoding="utf-8",
+    )
+    glossary = Glossary.from_config(load_instructions(config).glossary)
+
+    text = "Sift the flour, then put the sack on a strip of tape and a stipe."
+    assert glossary.correct(text) == (text, 0)
+    assert glossary.correct("Post it in Slak.") == ("Post it in Slack.", 1)
+
+
+def test_glossary_fuzzy_is_off_by_default(tmp_path: Path) -> None:
+    config = tmp_path / "instructions.toml"
+    config.write_text("[glossary.terms]\nPydantic = []\n", encoding="utf-8")
+
+    assert load_instructions(config).glossary.fuzzy is False
+
+
+def test_pipeline_skips_ai_for_cues_fixed_by_glossary(tmp_path: Path, monkeypatch) -> None:
+    config = tmp_path / "instructions.toml"
+    config.write_text(
+        "[glossary]\n"
+        "skip_ai_for_corrected = true\n"
+        "[glossary.terms]\n"
+        'UNIQUE_TEXT_ONE = ["unique_txt_one"]\n',
+        encoding="utf-8",
+    )
+    source = tmp_path / "input.itt"
+    fixture = Path(__file__).parent / "fixtures" / "sample.itt"
+    source.write_text(
+        fixture.read_text(encoding="utf-8").replace("UNIQUE_TEXT_ONE", "unique_txt_one"),
+        encoding="utf-8",
+    )
+    sent: list[str] = []
+
+    def _tier(chunk: list[Segment]) -> tuple[list[Segment], None]:
+        sent.extend(segment.text for segment in chunk)
+        return [replace(segment, text=segment.text + " ok") for segment in chunk], None
+
+    monkeypatch.setattr(ai_openai, "make_openai_tier", lambda *args, **kwargs: _tier)
+    output = tmp_path / "output.itt"
+
+    run_pipeline(
+        audio_path=tmp_path / "audio.m4a",
+        itt_path=source,
+        instructions=load_instructions(config),
+        output_path=output,
+        allow_timing_adjust=True,
+        enable_ai=True,
+    )
+
+    assert sent == ["Bravo UNIQUE_TEXT_TWO"]
+    patched = output.read_text(encoding="utf-8")
+    assert "Alpha UNIQUE_TEXT_ONE<" in patched
+    assert "Bravo UNIQUE_TEXT_TWO ok" in patched
+
+
+def test_edit_ratio_guard_keeps_glossary_corrections(tmp_path: Path, monkeypatch) -> None:
+    config = tmp_path / "instructions.toml"
+    config.write_text(
+        "[ai]\nmax_edit_ratio = 0.4\n[glossary.terms]\nPydantic = [\"pedantic\"]\n",
+        encoding="utf-8",
+    )
+    source = tmp_path / "input.itt"
+    fixture = Path(__file__).parent / "fixtures" / "sample.itt"
+    source.write_text(
+        fixture.read_text(encoding="utf-8")
+        .replace("Alpha UNIQUE_TEXT_ONE", "pedantic models")
+        .replace("Bravo UNIQUE_TEXT_TWO", "pedantic data"),
+        encoding="utf-8",
+    )
+
+    def _tier(chunk: list[Segment]) -> tuple[list[Segment], None]:
+        # The first cue is rewritten wholesale; the second gets a small fix.
+        return [
+            replace(chunk[0], text="Something else"),
+            replace(chunk[1], text=chunk[1].text + " here"),
+        ], None
+
+    monkeypatch.setattr(ai_openai, "make_openai_tier", lambda *args, **kwargs: _tier)
+
+    for enable_ai in (False, True):
+        output = tmp_path / f"output.{enable_ai}.itt"
+        run_pipeline(
+            audio_path=tmp_path / "audio.m4a",
+            itt_path=source,
+            instructions=load_instructions(config),
+            output_path=output,
+            allow_timing_adjust=True,
+            enable_ai=enable_ai,
+        )
+
+        patched = output.read_text(encoding="utf-8")
+        assert ">Pydantic models<" in patched
+        changes = output.with_suffix(".changes.txt").read_text(encoding="utf-8")
+        assert "Rejected: Pydantic" not in changes
+    # Against the original, the small fix would be a 0.60 edit ratio.
+    assert ">Pydantic data here<" in patched
+    assert "Rejected: Something else" in changes
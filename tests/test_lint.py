@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+
+from transcribe_enhance.application.lint import lint_file, lint_files
+from transcribe_enhance.delivery.cli import main
+from transcribe_enhance.domain.models import OutputRules, Segment
+from transcribe_enhance.domain.rules import check_output_rules
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "sample.itt"
+LINE_BREAKS = Path(__file__).parent / "fixtures" / "line_breaks.itt"
+
+
+def _rules() -> OutputRules:
+    return OutputRules(
+        max_chars_per_line=20,
+        max_lines_per_caption=2,
+        max_reading_speed_cps=17,
+        min_duration_ms=700,
+        max_duration_ms=6000,
+        line_break_style="punctuation",
+        casing="sentence",
+        punctuation="standard",
+        profanity_policy="mask",
+        min_gap_ms=100,
+    )
+
+
+def test_check_output_rules_reports_each_violation() -> None:
+    segments = [
+        Segment(start_ms=0, end_ms=1000, text="Short"),
+        Segment(start_ms=900, end_ms=1200, text="Overlapping cue"),
+        Segment(start_ms=1250, end_ms=8000, text="One\nTwo\nThree"),
+        Segment(start_ms=8000, end_ms=9000, text="This line is far too long to read"),
+    ]
+
+    violations = check_output_rules(segments, _rules())
+
+    found = {(violation.index, violation.rule) for violation in violations}
+    assert found == {
+        (1, "overlap"),
+        (1, "min_duration"),
+        (1, "reading_speed"),
+        (2, "gap"),
+        (2, "max_duration"),
+        (2, "line_count"),
+        (3, "gap"),
+        (3, "line_length"),
+        (3, "reading_speed"),
+    }
+
+
+def test_lint_takes_caption_lines_from_br_elements() -> None:
+    report = lint_file(LINE_BREAKS, _rules())
+
+    # Cue 0 fits two <br/>-separated lines; cue 2 wraps only in the XML source.
+    assert {(violation.index, violation.rule) for violation in report.violations} == {
+        (1, "line_count"),
+    }
+
+
+def test_lint_files_in_process_pool_preserves_order(tmp_path: Path) -> None:
+    broken = tmp_path / "broken.itt"
+    broken.write_text("<tt", encoding="utf-8")
+    paths = [FIXTURE, broken, FIXTURE]
+
+    reports = lint_files(paths, _rules(), jobs=2)
+
+    assert [report.path for report in reports] == paths
+    assert reports[0].segment_count == 2
+    assert reports[0].violations
+    assert reports[1].error is not None
+    assert reports[0] == reports[2]
+
+
+def test_lint_cli_emits_json_lines(tmp_path: Path, capsys) -> None:
+    itt_dir = tmp_path / "captions"
+    itt_dir.mkdir()
+    (itt_dir / "episode.itt").write_bytes(FIXTURE.read_bytes())
+
+    exit_code = main(["lint", str(itt_dir), "--format", "json", "--jobs", "1"])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert exit_code == 0
+    assert len(lines) == 1
+    report = json.loads(lines[0])
+    assert report["path"].endswith("episode.itt")
+    assert report["segment_count"] == 2
+    assert report["violations"] == []
@@ -0,0 +1,123 @@
+import json
+from dataclasses import replace
+from types import SimpleNamespace
+
+from transcribe_enhance.domain.models import Context, Instructions, RetrievalConfig, Segment
+from transcribe_enhance.domain.retrieval import (
+    Bm25Index,
+    details_index,
+    estimate_tokens,
+    split_passages,
+)
+from transcribe_enhance.infrastructure.ai_openai import request_segments_openai
+from transcribe_enhance.infrastructure.toml_config import DEFAULT_AI, DEFAULT_OUTPUT_RULES
+
+
+DETAILS = """## Episode 2
+
+Refactor your API with type hints.
+
+### Pydantic Models
+
+Use Pydantic models for all DTOs and enforce validation at runtime.
+
+### Tests
+
+Use pytest to add some tests for the repository layer.
+
+### Deployment
+
+Deploy the service with Docker and configure health checks.
+"""
+
+
+def test_split_passages_keeps_section_headings() -> None:
+    passages = split_passages(DETAILS)
+
+    assert passages == [
+        "## Episode 2\n\nRefactor your API with type hints.",
+        "### Pydantic Models\n\nUse Pydantic models for all DTOs and enforce validation at runtime.",
+        "### Tests\n\nUse pytest to add some tests for the repository layer.",
+        "### Deployment\n\nDeploy the service with Docker and configure health checks.",
+    ]
+
+
+def test_select_returns_top_passages_in_document_order_under_cap() -> None:
+    index = Bm25Index(split_passages(DETAILS))
+    query = "now we write pytest tests and add pydantic validation"
+
+    selected = index.select(query, top_k=2, max_tokens=200)
+    assert selected.startswith("### Pydantic Models")
+    assert selected.endswith("repository layer.")
+    assert "Docker" not in selected
+
+    capped = index.select(query, top_k=2, max_tokens=estimate_tokens(selected) - 1)
+    assert capped.count("###") == 1
+
+
+def test_select_falls_back_to_opening_passages_without_matches() -> None:
+    index = Bm25Index(split_passages(DETAILS))
+
+    selected = index.select("Okay, yeah.", top_k=2, max_tokens=200)
+    assert selected == "\n\n".join(split_passages(DETAILS)[:2])
+
+    first_cost = estimate_tokens(split_passages(DETAILS)[0])
+    assert index.select("Okay, yeah.", top_k=2, max_tokens=first_cost) == (
+        split_passages(DETAILS)[0]
+    )
+
+
+def test_select_never_empties_details_without_blank_lines() -> None:
+    sentence = "The wizard walks along the river and talks about the long road ahead."
+    prose = " ".join([sentence] * 150 + ["Gandalf arrives at the gate."] + [sentence] * 20)
+    log = "\n".join(f"line {number} of the build log" for number in range(300))
+
+    for details in (prose, log):
+        passages = split_passages(details)
+        assert len(passages) > 1
+        assert all(len(passage.split()) <= 150 for passage in passages)
+        index = Bm25Index(passages)
+        for query in ("Gandalf", "Okay."):
+            selected = index.select(query, top_k=4, max_tokens=800)
+            assert selected
+            assert estimate_tokens(selected) <= 800
+    assert "Gandalf arrives" in Bm25Index(split_passages(prose)).select("Gandalf", 4, 800)
+
+    # A budget below one passage still gets the best passage, cut to fit.
+    tight = Bm25Index(split_passages(prose)).select("Gandalf", top_k=4, max_tokens=20)
+    assert tight
+    assert estimate_tokens(tight) <= 20
+
+
+def test_details_index_is_cached_by_content() -> None:
+    copy = "".join(list(DETAILS))
+
+    assert details_index(DETAILS) is details_index(copy)
+
+
+def test_payload_sends_only_relevant_details() -> None:
+    captured = {}
+    segments = [Segment(start_ms=0, end_ms=2000, text="Let's deploy it with Docker.")]
+
+    def _create(**kwargs):
+        captured.update(kwargs)
+        return SimpleNamespace(
+            output_text=json.dumps(
+                {"segment_count": 1, "segments": [{"id": 0, "text": segments[0].text}]}
+            )
+        )
+
+    client = SimpleNamespace(responses=SimpleNamespace(create=_create))
+    instructions = Instructions(
+        context=Context(purpose="", audience="", tone="", details=DETAILS),
+        output_rules=DEFAULT_OUTPUT_RULES,
+        ai=replace(DEFAULT_AI, retrieval=RetrievalConfig(top_k=1, max_tokens=500)),
+    )
+
+    request_segments_openai(client, segments, instructions, "model", 0.2)
+
+    user_content = captured["input"][1]["content"]
+    payload = json.loads(user_content[user_content.index("{") :])
+    assert payload["context"]["details"] == (
+        "### Deployment\n\nDeploy the service with Docker and configure health checks."
+    )
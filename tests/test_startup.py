@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+
+# Cumulative import time budget for the CLI module, in microseconds. Non-AI runs
+# should start in tens of milliseconds; the budget leaves headroom for slow CI.
+_CLI_IMPORT_BUDGET_US = 150_000
+
+_HEAVY_MODULES = ("openai", "httpx", "pydantic")
+
+
+def _import_cli_with_importtime() -> subprocess.CompletedProcess[str]:
+    script = (
+        "import sys\n"
+        "import transcribe_enhance.delivery.cli\n"
+        f"loaded = [name for name in {_HEAVY_MODULES!r} if name in sys.modules]\n"
+        "print(','.join(loaded))\n"
+    )
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def _cumulative_import_us(stderr: str, module: str) -> int:
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.split("|")
+        if fields[-1].strip() == module:
+            return int(fields[1])
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+def test_cli_import_does_not_load_provider_sdks() -> None:
+    result = _import_cli_with_importtime()
+
+    assert result.stdout.strip() == ""
+
+
+def test_cli_import_within_startup_budget() -> None:
+    result = _import_cli_with_importtime()
+
+    elapsed_us = _cumulative_import_us(result.stderr, "transcribe_enhance.delivery.cli")
+
+    assert elapsed_us < _CLI_IMPORT_BUDGET_US
@@ -0,0 +1,161 @@
+from dataclasses import replace
+from pathlib import Path
+import threading
+
+from transcribe_enhance.application.pipeline import run_pipeline
+from transcribe_enhance.domain.models import Segment
+from transcribe_enhance.infrastructure import ai_openai
+from transcribe_enhance.infrastructure.toml_config import load_instructions
+
+
+FIXTURE = Path(__file__).parent / "fixtures" / "sample.itt"
+TARGETS_TOML = '[targets]\nsource_language = "en"\nlanguages = ["en", "es", "de"]\n'
+
+
+def test_request_bodies_share_prefix_across_languages(tmp_path: Path) -> None:
+    config = tmp_path / "instructions.toml"
+    config.write_text(TARGETS_TOML, encoding="utf-8")
+    instructions = load_instructions(config)
+    segments = [Segment(start_ms=0, end_ms=2000, text="Hello there.")]
+
+    bodies = {
+        language: ai_openai.build_request_body(
+            segments,
+            replace(instructions, ai=replace(instructions.ai, target_language=language)),
+            "model",
+            0.2,
+        )
+        for language in ("es", "de")
+    }
+    source = ai_openai.build_request_body(segments, instructions, "model", 0.2)
+
+    assert bodies["es"]["input"][:2] == bodies["de"]["input"][:2] == source["input"]
+    assert "into es" in bodies["es"]["input"][2]["content"]
+    assert "into de" in bodies["de"]["input"][2]["content"]
+
+
+def test_targets_write_one_output_per_language(tmp_path: Path, monkeypatch) -> None:
+    config = tmp_path / "instructions.toml"
+    config.write_text(
+        "[ai]\nmax_edit_ratio = 0.5\n\n" + TARGETS_TOML,
+        encoding="utf-8",
+    )
+    instructions = load_instructions(config)
+    # Every target must be in flight at once for all three to pass the barrier.
+    barrier = threading.Barrier(len(instructions.targets.languages), timeout=5)
+
+    def _make_tier(tier_instructions, model, temperature, with_confidence=False):
+        language = tier_instructions.ai.target_language
+
+        def _tier(chunk: list[Segment]) -> tuple[list[Segment], None]:
+            barrier.wait()
+            if language is None:
+                return [replace(segment, text=segment.text + ".") for segment in chunk], None
+            return [
+                replace(segment, text=f"{language} {idx}") for idx, segment in enumerate(chunk)
+            ], None
+
+        return _tier
+
+    monkeypatch.setattr(ai_openai, "make_openai_tier", _make_tier)
+
+    output = tmp_path / "out.itt"
+    run_pipeline(
+        audio_path=tmp_path / "audio.m4a",
+        itt_path=FIXTURE,
+        instructions=instructions,
+        output_path=output,
+        allow_timing_adjust=True,
+        enable_ai=True,
+    )
+
+    assert not output.exists()
+    source_text = FIXTURE.read_text(encoding="utf-8")
+    english = (tmp_path / "out.en.itt").read_text(encoding="utf-8")
+    assert "Alpha UNIQUE_TEXT_ONE." in english
+    assert 'xml:lang="en"' in english
+    for language in ("es", "de"):
+        translated = (tmp_path / f"out.{language}.itt").read_text(encoding="utf-8")
+        # Translations bypass max_edit_ratio and keep the source timing.
+        assert f">{language} 0<" in translated
+        assert f">{language} 1<" in translated
+        assert translated.count('begin="') == source_text.count('begin="')
+        assert f'xml:lang="{language}"' in translated
+        report = (tmp_path / f"out.{language}.changes.txt").read_text(encoding="utf-8")
+        assert "Before: Alpha UNIQUE_TEXT_ONE" in report
+        assert f"After: {language} 0" in report
+    assert (tmp_path / "out.en.changes.txt").read_text(encoding="utf-8").count("Change ") == 2
+
+
+def test_targets_translate_cues_skipped_by_glossary(tmp_path: Path, monkeypatch) -> None:
+    config = tmp_path / "instructions.toml"
+    config.write_text(
+        "[glossary]\n"
+        "skip_ai_for_corrected = true\n"
+        "[glossary.terms]\n"
+        'UNIQUE_TEXT_ONE = ["unique_txt_one"]\n\n' + TARGETS_TOML,
+        encoding="utf-8",
+    )
+    source = tmp_path / "input.itt"
+    source.write_text(
+        FIXTURE.read_text(encoding="utf-8").replace("UNIQUE_TEXT_ONE", "unique_txt_one"),
+        encoding="utf-8",
+    )
+
+    def _make_tier(tier_instructions, model, temperature, with_confidence=False):
+        prefix = tier_instructions.ai.target_language or "en"
+
+        def _tier(chunk: list[Segment]) -> tuple[list[Segment], None]:
+            return [replace(s, text=f"[{prefix}] {s.text}") for s in chunk], None
+
+        return _tier
+
+    monkeypatch.setattr(ai_openai, "make_openai_tier", _make_tier)
+
+    run_pipeline(
+        audio_path=tmp_path / "audio.m4a",
+        itt_path=source,
+        instructions=load_instructions(config),
+        output_path=tmp_path / "out.itt",
+        allow_timing_adjust=True,
+        enable_ai=True,
+    )
+
+    english = (tmp_path / "out.en.itt").read_text(encoding="utf-8")
+    assert ">Alpha UNIQUE_TEXT_ONE<" in english
+    assert ">[en] Bravo UNIQUE_TEXT_TWO<" in english
+    spanish = (tmp_path / "out.es.itt").read_text(encoding="utf-8")
+    assert ">[es] Alpha UNIQUE_TEXT_ONE<" in spanish
+    assert ">[es] Bravo UNIQUE_TEXT_TWO<" in spanish
+
+
+def test_translated_track_gets_language_when_source_has_none(
+    tmp_path: Path, monkeypatch
+) -> None:
+    config = tmp_path / "instructions.toml"
+    config.write_text(TARGETS_TOML, encoding="utf-8")
+    source = tmp_path / "input.itt"
+    source.write_text(
+        FIXTURE.read_text(encoding="utf-8").replace(' xml:lang="en"', ""),
+        encoding="utf-8",
+    )
+
+    def _make_tier(tier_instructions, model, temperature, with_confidence=False):
+        language = tier_instructions.ai.target_language or "en"
+        return lambda chunk: ([replace(s, text=f"{language} text") for s in chunk], None)
+
+    monkeypatch.setattr(ai_openai, "make_openai_tier", _make_tier)
+
+    run_pipeline(
+        audio_path=tmp_path / "audio.m4a",
+        itt_path=source,
+        instructions=load_instructions(config),
+        output_path=tmp_path / "out.itt",
+        allow_timing_adjust=True,
+        enable_ai=True,
+    )
+
+    assert "xml:lang" not in (tmp_path / "out.en.itt").read_text(encoding="utf-8")
+    for language in ("es", "de"):
+        translated = (tmp_path / f"out.{language}.itt").read_text(encoding="utf-8")
+        assert f'ttp:frameRate="30" xml:lang="{language}">' in translated